@@ -10,11 +10,18 @@ Import from here::
 
 from .ai_player import AIStrategy, SimpleAI
 from .game_session import GameSession
+from .minimax_ai import MinimaxAI, MTDFAI
+from .selfplay import run_selfplay
 from .serializer import (
     deserialize_game_state,
+    deserialize_game_state_binary,
     export_game_state,
+    export_game_state_bytes,
+    export_game_state_pickle,
+    export_game_state_stream,
     load_game_state,
     serialize_game_state,
+    serialize_game_state_binary,
     serialize_public_state,
 )
 
@@ -24,10 +31,19 @@ __all__ = [
     # AI strategies
     "AIStrategy",
     "SimpleAI",
+    "MinimaxAI",
+    "MTDFAI",
+    # Evaluation harness
+    "run_selfplay",
     # Serialization
     "serialize_public_state",
     "serialize_game_state",
     "deserialize_game_state",
+    "serialize_game_state_binary",
+    "deserialize_game_state_binary",
     "export_game_state",
+    "export_game_state_bytes",
+    "export_game_state_pickle",
+    "export_game_state_stream",
     "load_game_state",
 ]
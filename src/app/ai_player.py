@@ -68,6 +68,11 @@ class AIStrategy(ABC):
         must flow through this object so results are reproducible.
     """
 
+    # Strategies hold per-instance state in declared slots (or none at
+    # all) — no per-instance __dict__, and attribute access in the hot
+    # move-selection loops stays cheap.
+    __slots__ = ()
+
     @abstractmethod
     def choose_move(
         self,
@@ -95,9 +100,15 @@ class SimpleAI(AIStrategy):
     Single-ply greedy AI.  See module docstring for full strategy spec.
     """
 
+    __slots__ = ()
+
     _COINS_SUIT: str = "oro"
     _SETTEBELLO:  int = 7
 
+    # Bit flags for the per-turn coin-code view (see _table_coin_codes).
+    _ORO_BIT:   int = 0b01
+    _SETTE_BIT: int = 0b10
+
     def choose_move(
         self,
         engine: ScopaEngine,
@@ -107,50 +118,116 @@ class SimpleAI(AIStrategy):
     ) -> tuple[str, list[str]]:
         player = state.player_by_id(player_id)
 
-        # ── Enumerate every legal (card, combo) pair ──────────────────────────
-        all_moves: list[tuple[Card, list[Card]]] = [
-            (card, combo)
-            for card in player.hand
-            for combo in engine._find_sum_combinations(card.value, state.table)
-        ]
+        # ── Enumerate and score every legal (card, combo) pair once ──────────
+        # The coin codes are computed once per turn: each table card appears
+        # in many combos, so the string suit/value tests are paid once per
+        # card here instead of once per (card, combo) pair in _score.
+        # Hand cards sharing a value trigger identical subset-sum
+        # enumerations, so combos are cached per value for this turn.
+        # Everything touched inside the loops is bound to a local first —
+        # LOAD_FAST instead of repeated attribute/method lookups.
+        table      = state.table
+        table_size = len(table)
+        coin_codes = self._table_coin_codes(table)
+        get_code   = coin_codes.get
+        sette_bit  = self._SETTE_BIT
+        oro_bit    = self._ORO_BIT
+        find       = engine._find_sum_combinations
+        iter_find  = engine._iter_sum_combinations
+        hand       = player.hand
+        combo_cache: dict[int, list[list[Card]]] = {}
+        cached     = combo_cache.get
 
-        if not all_moves:
+        # Scoring kernel, inlined so the per-(card, combo) cost is pure
+        # bytecode with no method dispatch.  The score is packed into one
+        # int whose bit fields mirror the priority list in the module
+        # docstring, so ranking compares a single machine integer instead
+        # of a freshly allocated 5-tuple (scopa moves short-circuit before
+        # scoring and never enter this ranking):
+        #   bits 32+  cards_taken
+        #   bit 24    takes_settebello
+        #   bit 16    takes_oro
+        #   bits 0+   played_value
+        # A scopa (combo covering the whole table) outranks every other move,
+        # and all scopa combos contain the same cards, so once one is found
+        # the only remaining question is which hand card plays it — scoring
+        # of non-scopa moves stops immediately.
+        top_score = -1
+        candidates: list[tuple[Card, list[Card]]] = []
+        scopa_moves: list[tuple[Card, list[Card]]] = []
+        for card in hand:
+            value = card.value
+            if scopa_moves:
+                # Only another scopa can still compete — iterate lazily and
+                # stop at the first table-clearing combo, without
+                # materializing (or caching) the full enumeration.
+                for combo in iter_find(value, table):
+                    if len(combo) == table_size:
+                        scopa_moves.append((card, combo))
+                        break
+                continue
+            combos = cached(value)
+            if combos is None:
+                combos = combo_cache[value] = find(value, table)
+            for combo in combos:
+                combo_len = len(combo)
+                if combo_len == table_size:
+                    scopa_moves.append((card, combo))
+                    break
+                acc = 0
+                for c in combo:
+                    acc |= get_code(c.id, 0)
+                score = (
+                    (combo_len << 32)
+                    | ((acc & sette_bit) << 23)   # _SETTE_BIT (bit 1) → bit 24
+                    | ((acc & oro_bit) << 16)     # _ORO_BIT   (bit 0) → bit 16
+                    | value
+                )
+                # Running best + tie bucket — a strictly better score
+                # resets the bucket, an equal one joins it.
+                if score > top_score:
+                    top_score  = score
+                    candidates = [(card, combo)]
+                elif score == top_score:
+                    candidates.append((card, combo))
+
+        if scopa_moves:
+            # All scopa combos capture identical cards; prefer the highest
+            # played value, then the seeded RNG tie-break as usual.
+            best_val = max(c.value for c, _ in scopa_moves)
+            card, combo = rng.choice(
+                [m for m in scopa_moves if m[0].value == best_val]
+            )
+            return card.id, [c.id for c in combo]
+
+        if not candidates:
             discard = self._choose_discard(player.hand, rng)
             return discard.id, []
 
-        # ── Select best move(s), break ties with seeded RNG ───────────────────
-        table_size = len(state.table)
-        top_score  = max(self._score(card, combo, table_size) for card, combo in all_moves)
-        candidates = [
-            (card, combo)
-            for card, combo in all_moves
-            if self._score(card, combo, table_size) == top_score
-        ]
+        # ── Break ties between equal-best moves with seeded RNG ──────────────
         card, combo = rng.choice(candidates)
         return card.id, [c.id for c in combo]
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
-    def _score(
-        self,
-        card: Card,
-        combo: list[Card],
-        table_size: int,
-    ) -> tuple:
+    def _table_coin_codes(self, table: list[Card]) -> dict[str, int]:
         """
-        Return a comparable score tuple.  Larger = better.
+        Build the per-turn structure-of-arrays view of the table: a map from
+        ``Card.id`` to a small bit code (``_ORO_BIT`` / ``_SETTE_BIT``).
 
-        Tuple layout maps 1-to-1 with the priority list in the module docstring:
-        (is_scopa, cards_taken, takes_settebello, takes_oro, played_value)
+        Scoring then reduces each combo with a single bitwise OR per card
+        instead of re-running string suit comparisons for every (card, combo)
+        pair — the dataclass attribute reads happen once per table card.
         """
-        return (
-            len(combo) == table_size,                                           # 1. scopa
-            len(combo),                                                          # 2. most cards
-            any(c.suit == self._COINS_SUIT and c.value == self._SETTEBELLO
-                for c in combo),                                                 # 3. settebello
-            any(c.suit == self._COINS_SUIT for c in combo),                     # 4. any oro
-            card.value,                                                          # 5. high played value
-        )
+        coins_suit = self._COINS_SUIT
+        settebello = self._SETTEBELLO
+        oro_bit    = self._ORO_BIT
+        sette_bit  = self._SETTE_BIT
+        return {
+            c.id: (oro_bit | sette_bit) if c.value == settebello else oro_bit
+            for c in table
+            if c.suit == coins_suit
+        }
 
     def _choose_discard(
         self,
@@ -163,7 +240,26 @@ class SimpleAI(AIStrategy):
         Strategy: discard the lowest-value non-oro card; if the hand is
         entirely oro, discard the lowest oro.
         """
-        non_oro = [c for c in hand if c.suit != self._COINS_SUIT]
-        pool    = non_oro if non_oro else hand
-        min_val = min(c.value for c in pool)
-        return rng.choice([c for c in pool if c.value == min_val])
+        # One pass tracking the running minimum and its candidates; the
+        # second loop only runs for the rare all-oro hand.
+        oro = self._COINS_SUIT
+        min_val = 11  # above any legal card value
+        bucket: list[Card] = []
+        for c in hand:
+            if c.suit == oro:
+                continue
+            v = c.value
+            if v < min_val:
+                min_val = v
+                bucket  = [c]
+            elif v == min_val:
+                bucket.append(c)
+        if not bucket:
+            for c in hand:
+                v = c.value
+                if v < min_val:
+                    min_val = v
+                    bucket  = [c]
+                elif v == min_val:
+                    bucket.append(c)
+        return rng.choice(bucket)
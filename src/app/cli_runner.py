@@ -28,6 +28,7 @@ before a real UI (web/mobile) is connected.
 
 from __future__ import annotations
 
+import random
 import sys
 from typing import Optional
 
@@ -60,15 +61,28 @@ _VALUE_NAME: dict[int, str] = {
     6: "Sei",  7: "Sette", 8: "Otto", 9: "Nove", 10: "Re",
 }
 
+#: All 40 labels of the standard deck, formatted once at import time so the
+#: per-render cost of ``_card_label`` is a single dict lookup.
+_LABEL_CACHE: dict[tuple[str, int], str] = {
+    (suit, value): f"{value:>2} {_VALUE_NAME[value]:<9} {_SUIT_LABEL[suit]}"
+    for suit in _SUIT_LABEL
+    for value in _VALUE_NAME
+}
+
 
 def _card_label(card_data: dict) -> str:
     """
     Format a card dict as a short human-readable string.
 
     Example: ``" 7 Oro     🪙"`` (right-aligned value, fixed-width suit).
+    Known (suit, value) pairs come from the precomputed ``_LABEL_CACHE``;
+    the formatting path below only runs for non-standard decks.
     """
     value = card_data["value"]
     suit  = card_data["suit"]
+    label = _LABEL_CACHE.get((suit, value))
+    if label is not None:
+        return label
     name  = _VALUE_NAME.get(value, str(value))
     suit_label = _SUIT_LABEL.get(suit, suit.capitalize())
     return f"{value:>2} {name:<9} {suit_label}"
@@ -96,6 +110,9 @@ def _label_from_id(card_id: str) -> str:
         _, suit, value_str = parts
         try:
             value = int(value_str)
+            label = _LABEL_CACHE.get((suit, value))
+            if label is not None:
+                return label
             name  = _VALUE_NAME.get(value, value_str)
             suit_label = _SUIT_LABEL.get(suit, suit.capitalize())
             return f"{value:>2} {name:<9} {suit_label}"
@@ -106,8 +123,7 @@ def _label_from_id(card_id: str) -> str:
 
 # ── Output helpers ────────────────────────────────────────────────────────────
 
-def _print_header(session: GameSession) -> None:
-    pub = session.get_public_state()
+def _print_header(session: GameSession, pub: dict) -> None:
     print()
     print(_BOLD)
     print(
@@ -118,32 +134,35 @@ def _print_header(session: GameSession) -> None:
 
 
 def _print_scores(pub: dict, human_id: str) -> None:
-    print()
+    # Each section is joined and emitted as one print call — one stdout
+    # flush per section instead of one per line.
+    lines = [""]
     for pid, info in pub["players"].items():
-        label   = "You " if pid == human_id else "AI  "
-        pts     = pub["scores"].get(pid, 0)
-        print(
+        label = "You " if pid == human_id else "AI  "
+        pts   = pub["scores"].get(pid, 0)
+        lines.append(
             f"  {label}  captured: {info['captured_count']:>2}  "
             f"scopas: {info['scopas']}  "
             f"pts this round: {pts}"
         )
+    print("\n".join(lines))
 
 
 def _print_table(pub: dict) -> None:
     table = pub["table"]
-    print(f"\n  TABLE  ({len(table)} card{'s' if len(table) != 1 else ''})")
+    lines = [f"\n  TABLE  ({len(table)} card{'s' if len(table) != 1 else ''})"]
     if not table:
-        print("    (empty)")
+        lines.append("    (empty)")
     else:
-        for i, cd in enumerate(table):
-            print(f"    [{i}]  {_card_label(cd)}")
+        lines.extend(f"    [{i}]  {_card_label(cd)}" for i, cd in enumerate(table))
+    print("\n".join(lines))
 
 
 def _print_hand(pub: dict) -> None:
-    hand = pub["human_hand"]
-    print(f"\n  YOUR HAND  ({len(hand)} card{'s' if len(hand) != 1 else ''})")
-    for i, cd in enumerate(hand):
-        print(f"    [{i}]  {_card_label(cd)}")
+    hand  = pub["human_hand"]
+    lines = [f"\n  YOUR HAND  ({len(hand)} card{'s' if len(hand) != 1 else ''})"]
+    lines.extend(f"    [{i}]  {_card_label(cd)}" for i, cd in enumerate(hand))
+    print("\n".join(lines))
 
 
 def _pause() -> None:
@@ -165,14 +184,17 @@ def _prompt(msg: str) -> str:
         sys.exit(0)
 
 
-def _choose_card(session: GameSession) -> Optional[dict]:
+def _choose_card(pub: dict) -> Optional[dict]:
     """
     Interactively let the human pick a card from their hand.
 
+    *pub* is the turn's public-state snapshot from ``_play_human_turn`` —
+    the state cannot change while the human is choosing, so one snapshot
+    serves the whole turn.
+
     Returns the raw card dict (suitable for ``_card_label``), or ``None``
     if the hand is empty (defensive — should not happen during normal play).
     """
-    pub  = session.get_public_state()
     hand = pub["human_hand"]
     if not hand:
         return None
@@ -191,10 +213,15 @@ def _choose_card(session: GameSession) -> Optional[dict]:
 def _choose_capture(
     session: GameSession,
     card_dict: dict,
+    table_by_id: dict[str, dict],
 ) -> Optional[list[str]]:
     """
     Show capture options for *card_dict* and let the human choose.
 
+    *table_by_id* is the ``card_id`` → card-dict map for the current table,
+    built once per turn by ``_play_human_turn`` (the table cannot change
+    while the player is still picking, so re-picking via [B] reuses it).
+
     Returns
     -------
     list[str]
@@ -204,9 +231,7 @@ def _choose_capture(
     None
         Player cancelled (wants to re-select a different card).
     """
-    pub      = session.get_public_state()
-    table_by_id = {cd["id"]: cd for cd in pub["table"]}
-    combos   = session.get_legal_captures(card_dict["id"])
+    combos = session.get_legal_captures(card_dict["id"])
 
     label = _card_label(card_dict)
 
@@ -248,8 +273,12 @@ def _choose_capture(
 
 def _play_human_turn(session: GameSession) -> None:
     """Handle a complete human turn: display → card pick → capture pick → submit."""
-    _print_header(session)
+    # One snapshot serves the whole turn: header, table, scores, hand, and
+    # both selection prompts.  Nothing can mutate state until the move is
+    # submitted.
     pub = session.get_public_state()
+    table_by_id = {cd["id"]: cd for cd in pub["table"]}
+    _print_header(session, pub)
     _print_table(pub)
     _print_scores(pub, session.human_id)
     _print_hand(pub)
@@ -257,11 +286,11 @@ def _play_human_turn(session: GameSession) -> None:
     print("  YOUR TURN")
 
     while True:
-        card_dict = _choose_card(session)
+        card_dict = _choose_card(pub)
         if card_dict is None:
             break
 
-        capture_ids = _choose_capture(session, card_dict)
+        capture_ids = _choose_capture(session, card_dict, table_by_id)
         if capture_ids is None:
             continue  # player pressed B — re-pick card
 
@@ -314,12 +343,14 @@ def _play_ai_turn(session: GameSession) -> None:
 
 def _show_round_result(result: dict, human_id: str) -> None:
     """Display the end-of-round scoring breakdown."""
-    print()
-    print(_BOLD)
-    print(f"  ROUND {result['round_number']} COMPLETE")
-    print(_BOLD)
-
-    print("\n  Points awarded this round:")
+    lines = [
+        "",
+        _BOLD,
+        f"  ROUND {result['round_number']} COMPLETE",
+        _BOLD,
+        "",
+        "  Points awarded this round:",
+    ]
     for pid, pts in result["round_scores"].items():
         label      = "You" if pid == human_id else "AI "
         scopas     = result["scopas"].get(pid, 0)
@@ -327,14 +358,16 @@ def _show_round_result(result: dict, human_id: str) -> None:
             f"  (incl. {scopas} scopa{'s' if scopas != 1 else ''})"
             if scopas else ""
         )
-        print(f"    {label}  {pts:>2} pt{'s' if pts != 1 else ''}{scopa_note}")
+        lines.append(f"    {label}  {pts:>2} pt{'s' if pts != 1 else ''}{scopa_note}")
 
-    print("\n  Session totals:")
+    lines.append("")
+    lines.append("  Session totals:")
     for pid, total in result["cumulative"].items():
         label = "You" if pid == human_id else "AI "
-        print(f"    {label}  {total:>3} pts")
+        lines.append(f"    {label}  {total:>3} pts")
 
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
 def play_round(session: GameSession) -> dict:
@@ -378,7 +411,6 @@ def main() -> None:
         seed = int(seed_input)
         print(f"  Using seed: {seed}")
     else:
-        import random
         seed = random.randint(0, 999_999)
         print(f"  Random seed: {seed}  (note it down to replay this game)")
 
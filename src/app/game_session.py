@@ -43,10 +43,9 @@ Persistence
 from __future__ import annotations
 
 import random
+from types import MappingProxyType
 from typing import Optional
 
-import src.decks  # noqa: F401 — registers all deck definitions on first import
-
 from src.engine import (
     GameConfig,
     GameState,
@@ -60,6 +59,7 @@ from .ai_player import AIStrategy, SimpleAI
 from .serializer import (
     deserialize_game_state,
     export_game_state,
+    export_game_state_stream,
     serialize_public_state,
 )
 
@@ -110,6 +110,18 @@ class GameSession:
         self._state:        Optional[GameState] = None
         self._ai_rng:       random.Random       = random.Random(seed)
         self._round_number: int                 = 0
+        # Memoised serialize_public_state result for the current state
+        # object (states are replaced, never mutated, after each engine
+        # call).  Cleared whenever self._state is reassigned.
+        self._public_cache: Optional[dict]      = None
+        # Lazily built {card.id: Card} index over the human's current
+        # hand, so per-card UI queries avoid a linear hand scan.  Shares
+        # the _public_cache invalidation points.
+        self._hand_index:   Optional[dict]      = None
+        # Capture combos memoised per card value for the current table.
+        # Hand cards sharing a value trigger identical subset-sum
+        # enumerations; one result serves them all until the state moves.
+        self._capture_cache: dict[int, list[list[str]]] = {}
 
         self.cumulative_scores: dict[str, int] = {pid: 0 for pid in self.player_ids}
         self.round_history:     list[dict]     = []
@@ -125,9 +137,20 @@ class GameSession:
         """
         self._round_number += 1
         round_seed = (self.seed + self._round_number) if self.seed is not None else None
-        self._ai_rng = random.Random(round_seed)
+        # Reseeding in place yields the same sequence as a fresh
+        # random.Random(round_seed) without rebuilding the generator's
+        # internal state object every round.
+        self._ai_rng.seed(round_seed)
+
+        # Deferred: importing src.app (e.g. for the serializer alone) no
+        # longer triggers deck registration; the first round pays a
+        # sys.modules lookup at most.
+        import src.decks  # noqa: F401 — registers all deck definitions
 
         cards       = loadDeck(self.deck_name)
+        self._public_cache = None
+        self._hand_index   = None
+        self._capture_cache.clear()
         self._state = self._engine.create_game(
             cards,
             self.player_ids,
@@ -169,6 +192,9 @@ class GameSession:
             If an exact-value match must be captured instead of a sum combo.
         """
         self._require_active()
+        self._public_cache = None
+        self._hand_index   = None
+        self._capture_cache.clear()
         self._state = self._engine.play_card(
             self._state, self.human_id, card_id, capture_ids
         )
@@ -201,6 +227,9 @@ class GameSession:
         card_id, capture_ids = self._ai.choose_move(
             self._engine, self._state, self.ai_id, self._ai_rng
         )
+        self._public_cache = None
+        self._hand_index   = None
+        self._capture_cache.clear()
         self._state = self._engine.play_card(
             self._state, self.ai_id, card_id, capture_ids
         )
@@ -215,9 +244,15 @@ class GameSession:
 
         Strips: opponent hand cards, deck order.
         Includes: human hand, table, captured counts, deck size, turn info.
+
+        The snapshot is cached until the next move / round transition, so
+        repeated polls of an unchanged state return the same dict without
+        re-serialising.  Treat the result as read-only.
         """
         self._require_active()
-        return serialize_public_state(self._state, self.human_id)
+        if self._public_cache is None:
+            self._public_cache = serialize_public_state(self._state, self.human_id)
+        return self._public_cache
 
     def get_legal_captures(self, card_id: str) -> list[list[str]]:
         """
@@ -242,12 +277,19 @@ class GameSession:
             If *card_id* is not in the human's hand.
         """
         self._require_active()
-        human = self._state.player_by_id(self.human_id)
-        card  = next((c for c in human.hand if c.id == card_id), None)
+        if self._hand_index is None:
+            human = self._state.player_by_id(self.human_id)
+            self._hand_index = {c.id: c for c in human.hand}
+        card = self._hand_index.get(card_id)
         if card is None:
             raise KeyError(f"Card '{card_id}' is not in the human's hand.")
-        combos = self._engine._find_sum_combinations(card.value, self._state.table)
-        return [[c.id for c in combo] for combo in combos]
+        options = self._capture_cache.get(card.value)
+        if options is None:
+            combos = self._engine._find_sum_combinations(card.value, self._state.table)
+            options = self._capture_cache[card.value] = [
+                [c.id for c in combo] for combo in combos
+            ]
+        return options
 
     def is_round_over(self) -> bool:
         """Return ``True`` when the deck and all hands are empty."""
@@ -256,22 +298,37 @@ class GameSession:
             and self._engine.is_round_over(self._state)
         )
 
-    def get_final_scores(self) -> dict:
+    def get_final_scores(self, copy: bool = False) -> dict:
         """
         Finalise the round: award table remainder, compute all scoring
         categories, update cumulative totals, archive the round.
 
         Call exactly once after ``is_round_over()`` returns ``True``.
 
+        Parameters
+        ----------
+        copy:
+            By default the payload shares the finalised score dicts —
+            ``round_scores`` is the finished state's own dict (no later
+            round touches it) and ``cumulative`` is a read-only live view
+            of the session totals.  Pass ``True`` for independent copies,
+            e.g. when the payload goes straight into ``json.dumps``
+            (``MappingProxyType`` is not JSON-serialisable).
+
         Returns
         -------
         dict
             ``{round_scores, cumulative, round_number, scopas}``
         """
         self._require_active()
+        self._public_cache = None
+        self._hand_index   = None
+        self._capture_cache.clear()
         self._state = self._engine.calculate_round_score(self._state)
 
-        round_scores: dict[str, int] = dict(self._state.scores)
+        # The finished state is never mutated again (the next round builds
+        # a fresh one), so its scores dict can be shared rather than copied.
+        round_scores: dict[str, int] = self._state.scores
         for pid, pts in round_scores.items():
             self.cumulative_scores[pid] += pts
 
@@ -283,8 +340,12 @@ class GameSession:
         self.round_history.append(entry)
 
         return {
-            "round_scores":  round_scores,
-            "cumulative":    dict(self.cumulative_scores),
+            "round_scores":  dict(round_scores) if copy else round_scores,
+            "cumulative":    (
+                dict(self.cumulative_scores)
+                if copy
+                else MappingProxyType(self.cumulative_scores)
+            ),
             "round_number":  self._round_number,
             "scopas":        entry["scopas"],
         }
@@ -308,7 +369,7 @@ class GameSession:
 
     # ── Persistence ───────────────────────────────────────────────────────────
 
-    def export(self) -> dict:
+    def export(self, fp=None) -> Optional[dict]:
         """
         Serialise the full session to a JSON-ready ``dict``.
 
@@ -317,7 +378,15 @@ class GameSession:
             snapshot = session.export()
             restored = GameSession.from_snapshot(snapshot)
             # `restored` resumes from exactly the same state.
+
+        When *fp* (a text file-like object) is given, the snapshot JSON is
+        streamed directly into it instead — the nested dict is never built,
+        keeping peak memory flat during autosaves.  Returns ``None`` in
+        that mode.
         """
+        if fp is not None:
+            export_game_state_stream(self, fp)
+            return None
         return export_game_state(self)
 
     @classmethod
@@ -329,6 +398,9 @@ class GameSession:
         ----------
         data:
             JSON-parsed ``dict`` from a previous ``export()`` call.
+            Ownership transfers to the session: ``round_history`` is
+            adopted as-is (its entries were always shared even with a
+            shallow copy), so don't mutate *data* after restoring.
 
         Returns
         -------
@@ -342,7 +414,7 @@ class GameSession:
         )
         session._round_number     = int(data["round_number"])
         session.cumulative_scores = {k: int(v) for k, v in data["cumulative_scores"].items()}
-        session.round_history     = list(data["round_history"])
+        session.round_history     = data["round_history"]
 
         if data.get("current_state") is not None:
             session._state = deserialize_game_state(data["current_state"])
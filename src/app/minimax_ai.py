@@ -0,0 +1,731 @@
+"""
+src/app/minimax_ai.py
+=====================
+Look-ahead AI strategy: depth-limited negamax with alpha-beta pruning and
+a Zobrist-keyed transposition table.
+
+This is the "Minimax" extension path promised in ``ai_player.py``: it plugs
+into ``GameSession`` exactly like ``SimpleAI``::
+
+    session = GameSession(ai_strategy=MinimaxAI(depth=4))
+
+Search design
+-------------
+* **Negamax** formulation — one recursive function; the score is always
+  from the perspective of the player to move, negated at each ply.
+* **Alpha-beta pruning** — with reasonable move ordering this cuts the
+  effective branching factor to roughly its square root.
+* **Transposition table** — Scopa positions transpose heavily (the same
+  table can be reached by different move orders), so search results are
+  cached under a Zobrist hash of the position with the usual
+  EXACT / LOWER / UPPER bound flags.  The table is kept across moves
+  within a round and reset when a new round starts.
+* **Move ordering** — the cached best move from the transposition table is
+  tried first; remaining moves are ordered by the same greedy priorities
+  ``SimpleAI`` uses (scopa, combo size, settebello, oro, played value).
+
+Determinism note
+----------------
+The engine hands the strategy the *full* ``GameState`` — including the
+opponent's hand and the deck order — and the search uses it, mirroring how
+the simulation harness treats the engine as deterministic.  The injected
+``rng`` only breaks ties between equally valued root moves.
+
+Evaluation
+----------
+Terminal positions (round over) are scored with the engine's own
+``calculate_round_score`` and returned as exact point differentials.
+Depth-cutoff positions use a material heuristic over captured piles:
+scopas and the settebello at full point weight, plus small weights for
+card and coin majorities that approximate the most-cards / most-coins /
+primiera points still in play.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Optional
+
+from src.engine import Card, GameState, ScopaEngine
+
+from .ai_player import AIStrategy
+
+# ── Search constants ──────────────────────────────────────────────────────────
+
+#: A move as passed to ``ScopaEngine.play_card``: (card_id, capture_ids).
+#: Capture ids are stored as a tuple so moves are hashable TT entries.
+Move = tuple[str, tuple[str, ...]]
+
+_INF: int = 10 ** 9
+
+# Transposition-table bound flags
+_EXACT: int = 0
+_LOWER: int = 1
+_UPPER: int = 2
+
+# Evaluation scale: one real Scopa point = 100 heuristic units.
+_POINT:   int = 100
+_W_SCOPA: int = 100   # banked — a scopa is a guaranteed point
+_W_SETTE: int = 100   # banked — settebello is a guaranteed point
+_W_CARD:  int = 5     # contributes to the most-cards point
+_W_COIN:  int = 12    # contributes to most-coins and primiera
+
+_COINS_SUIT: str = "oro"
+_SETTEBELLO: int = 7
+
+#: Half-width of the aspiration window around the previous depth's value
+#: (half a real point).  Wide enough that re-searches are rare, narrow
+#: enough that most nodes cut immediately.
+_ASPIRATION: int = _POINT // 2
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  Zobrist hashing
+# ════════════════════════════════════════════════════════════════════════════
+
+class _ZobristKeys:
+    """
+    Lazily grown store of 64-bit Zobrist keys.
+
+    A position hash is the XOR of one key per (card id, location) pair plus
+    a side-to-move key and per-player scopa-count keys.  Keys are drawn from
+    a fixed-seed RNG, so hashes are stable across processes and runs.
+
+    Location codes: ``0`` table, ``1 + player_index`` hands,
+    ``3 + player_index`` captured piles.
+    """
+
+    __slots__ = ("_rng", "_keys", "turn_key")
+
+    def __init__(self, seed: int = 0x5C07A) -> None:
+        self._rng: random.Random = random.Random(seed)
+        self._keys: dict[tuple[str, int], int] = {}
+        self.turn_key: int = self._rng.getrandbits(64)
+
+    def key(self, card_id: str, location: int) -> int:
+        """Return (creating on first use) the key for *card_id* at *location*."""
+        k = self._keys.get((card_id, location))
+        if k is None:
+            k = self._keys[(card_id, location)] = self._rng.getrandbits(64)
+        return k
+
+    def scopa_key(self, player_index: int, scopas: int) -> int:
+        """Key folding a player's scopa count into the hash (0 → identity)."""
+        if scopas == 0:
+            return 0
+        return self.key(f"scopa::{player_index}::{scopas}", -1)
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  MinimaxAI
+# ════════════════════════════════════════════════════════════════════════════
+
+class _SearchTimeout(Exception):
+    """Internal: unwinds the search when the wall-clock budget is spent."""
+
+
+class _RootCutoff(Exception):
+    """Internal: aborts outstanding parallel root siblings after a cutoff."""
+
+
+def _search_root_child(
+    state: GameState,
+    depth: int,
+    alpha: int,
+    beta: int,
+) -> int:
+    """
+    Search one root child in a worker process.
+
+    Module-level so only the (picklable) child state and window cross the
+    process boundary; the worker builds its own engine and searcher with a
+    fresh local transposition table.
+    """
+    searcher = MinimaxAI(depth=max(depth, 1))
+    searcher._killers = [[None, None] for _ in range(depth + 2)]
+    return -searcher._negamax(ScopaEngine(), state, depth, -beta, -alpha, 1)
+
+
+class MinimaxAI(AIStrategy):
+    """
+    Negamax + alpha-beta strategy with a transposition table and an
+    iterative-deepening driver.
+
+    The driver searches depth 1, then 2, … up to *depth*: shallow passes
+    are cheap, seed the transposition table with best moves that make the
+    deeper passes prune far better, and — when a *time_budget* is set —
+    guarantee there is always a fully searched move to fall back on when
+    the clock runs out mid-depth.
+
+    Parameters
+    ----------
+    depth:
+        Maximum search depth in plies.  3–5 is responsive on the small
+        Scopa branching factor; each extra ply roughly squares the work
+        before pruning.
+    time_budget:
+        Optional wall-clock budget in seconds per move.  When spent, the
+        search unwinds and the best move from the last *completed* depth
+        is played.  ``None`` always searches to full *depth*.
+    root_workers:
+        When set, root moves are searched in parallel across that many
+        worker processes in Young-Brothers-Wait style: the first
+        (best-ordered) root move is searched serially to establish a
+        sound alpha, then the remaining siblings are dispatched to the
+        pool with that bound.  Workers run with their own local
+        transposition tables (sharing one through IPC costs more than
+        the re-search it saves at this tree size), so the parallel
+        search proves the same best move with some duplicated work.
+        ``None`` (default) keeps the search fully serial.
+    """
+
+    __slots__ = (
+        "depth",
+        "time_budget",
+        "root_workers",
+        "_executor",
+        "_zobrist",
+        "_tt",
+        "_last_deck_len",
+        "_deadline",
+        "_nodes",
+        "_killers",
+        "_history",
+        "_root_value",
+    )
+
+    def __init__(
+        self,
+        depth: int = 3,
+        time_budget: Optional[float] = None,
+        root_workers: Optional[int] = None,
+    ) -> None:
+        if depth < 1:
+            raise ValueError(f"MinimaxAI depth must be >= 1, got {depth}.")
+        self.depth: int = depth
+        self.time_budget: Optional[float] = time_budget
+        self.root_workers: Optional[int] = root_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._zobrist: _ZobristKeys = _ZobristKeys()
+        # zobrist hash → (depth, flag, value, best_move)
+        self._tt: dict[int, tuple[int, int, int, Optional[Move]]] = {}
+        self._last_deck_len: int = 40
+        self._deadline: Optional[float] = None
+        self._nodes: int = 0
+        # Move-ordering heuristics: two killer moves per ply (reset per
+        # choose_move) and cutoff-frequency history counters (kept with
+        # the TT for the round).
+        self._killers: list[list[Optional[Move]]] = []
+        self._history: dict[Move, int] = {}
+        # Root value of the last completed depth — seeds the aspiration
+        # window for the next one.  None until depth 1 completes.
+        self._root_value: Optional[int] = None
+
+    # ── AIStrategy API ────────────────────────────────────────────────────────
+
+    def choose_move(
+        self,
+        engine: ScopaEngine,
+        state: GameState,
+        player_id: str,
+        rng: random.Random,
+    ) -> tuple[str, list[str]]:
+        # A growing deck means a new round started — cached search results
+        # refer to a different deck order and must be dropped.
+        if len(state.deck) > self._last_deck_len:
+            self._tt.clear()
+            self._history.clear()
+        self._last_deck_len = len(state.deck)
+        self._killers = [[None, None] for _ in range(self.depth + 1)]
+
+        moves = self._legal_moves(engine, state)
+        if len(moves) == 1:
+            card_id, capture_ids = moves[0]
+            return card_id, list(capture_ids)
+
+        self._deadline = (
+            time.monotonic() + self.time_budget
+            if self.time_budget is not None
+            else None
+        )
+        self._nodes = 0
+
+        # Iterative deepening: each completed depth refreshes the candidate
+        # set; the previous depth's best move is searched first at the next
+        # depth (via pv_move and the TT) so pruning stays near-optimal.
+        best_moves: Optional[list[Move]] = None
+        pv_move: Optional[Move] = None
+        self._root_value = None
+        for d in range(1, self.depth + 1):
+            try:
+                candidates = self._search_root(engine, state, d, moves, pv_move)
+            except _SearchTimeout:
+                break
+            best_moves = candidates
+            pv_move = candidates[0]
+
+        if best_moves is None:
+            # Budget spent before depth 1 completed — fall back to the
+            # greedy ordering, which needs no search at all.
+            best_moves = [self._order_moves(state, moves, self._tt_move(state))[0]]
+
+        card_id, capture_ids = rng.choice(best_moves)
+        return card_id, list(capture_ids)
+
+    def _search_root(
+        self,
+        engine: ScopaEngine,
+        state: GameState,
+        depth: int,
+        moves: list[Move],
+        pv_move: Optional[Move],
+    ) -> list[Move]:
+        """
+        Run one root search at *depth*.
+
+        After depth 1, the search opens with an aspiration window of
+        ``±_ASPIRATION`` around the previous depth's value — scores rarely
+        swing between adjacent depths, so the narrow window prunes far
+        harder than a full-width pass.  A value landing on or outside the
+        window edge is unreliable (fail-soft bound, not an exact score)
+        and triggers one full-width re-search.
+
+        Returns all root moves sharing the best value (first element is the
+        principal move).  Raises :class:`_SearchTimeout` when the budget
+        expires mid-search.
+        """
+        prev = self._root_value
+        if prev is not None:
+            low, high = prev - _ASPIRATION, prev + _ASPIRATION
+            value, best_moves = self._root_pass(
+                engine, state, depth, moves, low, high, pv_move
+            )
+            if low < value < high:
+                self._root_value = value
+                return best_moves
+            if best_moves:
+                pv_move = best_moves[0]
+        value, best_moves = self._root_pass(
+            engine, state, depth, moves, -_INF, _INF, pv_move
+        )
+        self._root_value = value
+        return best_moves
+
+    # ── Search core ───────────────────────────────────────────────────────────
+
+    def _root_pass(
+        self,
+        engine: ScopaEngine,
+        state: GameState,
+        depth: int,
+        moves: list[Move],
+        gamma_low: int,
+        gamma_high: int,
+        pv_move: Optional[Move],
+    ) -> tuple[int, list[Move]]:
+        """
+        One alpha-beta pass over the root moves with window
+        ``(gamma_low, gamma_high)``.
+
+        Returns the fail-soft value and all root moves that share it
+        (principal move first).  Shared by the full-window iterative
+        deepening driver and the null-window MTD(f) driver.
+        """
+        ordered = self._order_moves(
+            state, moves, pv_move or self._tt_move(state), ply=0
+        )
+
+        # Young-Brothers-Wait: only worth it for real subtrees, and the
+        # cross-process deadline cannot be enforced, so time-budgeted
+        # searches stay serial.
+        if (
+            self.root_workers
+            and depth >= 2
+            and len(ordered) > 2
+            and self._deadline is None
+        ):
+            return self._root_pass_parallel(
+                engine, state, depth, ordered, gamma_low, gamma_high
+            )
+
+        best_value = -_INF
+        best_moves: list[Move] = []
+        alpha = gamma_low
+        for move in ordered:
+            child = self._apply(engine, state, move)
+            value = -self._negamax(engine, child, depth - 1, -gamma_high, -alpha, 1)
+            if value > best_value:
+                best_value = value
+                best_moves = [move]
+                alpha = max(alpha, value)
+            elif value == best_value:
+                best_moves.append(move)
+            if alpha >= gamma_high:
+                break
+        return best_value, best_moves
+
+    def _root_pass_parallel(
+        self,
+        engine: ScopaEngine,
+        state: GameState,
+        depth: int,
+        ordered: list[Move],
+        gamma_low: int,
+        gamma_high: int,
+    ) -> tuple[int, list[Move]]:
+        """
+        Parallel variant of the root pass (see ``root_workers``).
+
+        The eldest brother is searched serially to establish alpha; the
+        younger brothers are then dispatched to worker processes with that
+        bound and gathered as they complete.  A beta cutoff cancels any
+        siblings that have not started yet (best effort).
+        """
+        first = ordered[0]
+        child = self._apply(engine, state, first)
+        best_value = -self._negamax(engine, child, depth - 1, -gamma_high, -gamma_low, 1)
+        best_moves = [first]
+        alpha = max(gamma_low, best_value)
+        if alpha >= gamma_high:
+            self._record_cutoff(first, depth, 0)
+            return best_value, best_moves
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.root_workers)
+
+        futures = {
+            self._executor.submit(
+                _search_root_child,
+                self._apply(engine, state, move),
+                depth - 1,
+                alpha,
+                gamma_high,
+            ): move
+            for move in ordered[1:]
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    move = futures[future]
+                    value = future.result()
+                    if value > best_value:
+                        best_value = value
+                        best_moves = [move]
+                        alpha = max(alpha, value)
+                    elif value == best_value:
+                        best_moves.append(move)
+                    if alpha >= gamma_high:
+                        raise _RootCutoff
+        except _RootCutoff:
+            for future in pending:
+                future.cancel()
+        return best_value, best_moves
+
+    def close(self) -> None:
+        """Shut down the root-search worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _negamax(
+        self,
+        engine: ScopaEngine,
+        state: GameState,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int = 0,
+    ) -> int:
+        """
+        Return the negamax value of *state* from the mover's perspective.
+
+        Implements fail-soft alpha-beta with transposition-table probes and
+        stores; *depth* 0 falls through to the static evaluation.
+        """
+        # Budget check amortised over 64 nodes — time.monotonic() per node
+        # would cost more than the search bookkeeping it guards.
+        self._nodes += 1
+        if (
+            self._deadline is not None
+            and (self._nodes & 63) == 0
+            and time.monotonic() > self._deadline
+        ):
+            raise _SearchTimeout
+
+        if engine.is_round_over(state):
+            return self._terminal_value(engine, state)
+
+        key = self._hash(state)
+        tt_move: Optional[Move] = None
+        entry = self._tt.get(key)
+        if entry is not None:
+            entry_depth, flag, value, tt_move = entry
+            if entry_depth >= depth:
+                if flag == _EXACT:
+                    return value
+                if flag == _LOWER:
+                    alpha = max(alpha, value)
+                elif flag == _UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        if depth <= 0:
+            return self._evaluate(state)
+
+        alpha_orig = alpha
+        best = -_INF
+        best_move: Optional[Move] = None
+
+        moves = self._legal_moves(engine, state)
+        for move in self._order_moves(state, moves, tt_move, ply):
+            child = self._apply(engine, state, move)
+            value = -self._negamax(engine, child, depth - 1, -beta, -alpha, ply + 1)
+            if value > best:
+                best = value
+                best_move = move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                # Beta cutoff: remember this move for sibling nodes
+                # (killers) and for global ordering (history).
+                self._record_cutoff(move, depth, ply)
+                break
+
+        if best <= alpha_orig:
+            flag = _UPPER
+        elif best >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._tt[key] = (depth, flag, best, best_move)
+        return best
+
+    # ── Move generation / application ─────────────────────────────────────────
+
+    @staticmethod
+    def _legal_moves(engine: ScopaEngine, state: GameState) -> list[Move]:
+        """
+        Enumerate the mover's moves: every legal capture per hand card, or a
+        discard for cards with no capture.  Discarding a card that *could*
+        capture is legal in the engine but never advantageous, so those
+        branches are pruned at generation time.
+        """
+        moves: list[Move] = []
+        combo_cache: dict[int, list[list[Card]]] = {}
+        table = state.table
+        for card in state.current_player.hand:
+            combos = combo_cache.get(card.value)
+            if combos is None:
+                combos = combo_cache[card.value] = engine._find_sum_combinations(
+                    card.value, table
+                )
+            if combos:
+                for combo in combos:
+                    moves.append((card.id, tuple(c.id for c in combo)))
+            else:
+                moves.append((card.id, ()))
+        return moves
+
+    @staticmethod
+    def _apply(engine: ScopaEngine, state: GameState, move: Move) -> GameState:
+        """Apply *move* for the current player and run the automatic deal."""
+        card_id, capture_ids = move
+        child = engine.play_card(
+            state, state.current_player.id, card_id, list(capture_ids)
+        )
+        return engine.deal_if_needed(child)
+
+    def _record_cutoff(self, move: Move, depth: int, ply: int) -> None:
+        """Update the killer slots and history counter after a beta cutoff."""
+        if ply < len(self._killers):
+            killers = self._killers[ply]
+            if move != killers[0]:
+                killers[1] = killers[0]
+                killers[0] = move
+        self._history[move] = self._history.get(move, 0) + depth * depth
+
+    def _order_moves(
+        self,
+        state: GameState,
+        moves: list[Move],
+        tt_move: Optional[Move],
+        ply: Optional[int] = None,
+    ) -> list[Move]:
+        """
+        Order *moves* best-first: the transposition-table move, then this
+        ply's killer moves, then the rest by history-heuristic counters
+        with the greedy SimpleAI priorities as tie-break, discards last.
+        """
+        table_size = len(state.table)
+        coin_ids = {
+            c.id: 2 if c.value == _SETTEBELLO else 1
+            for c in state.table
+            if c.suit == _COINS_SUIT
+        }
+        history = self._history
+
+        def greedy_key(move: Move) -> tuple[int, int]:
+            capture_ids = move[1]
+            acc = 0
+            for cid in capture_ids:
+                acc |= coin_ids.get(cid, 0)
+            packed = (
+                ((len(capture_ids) == table_size and table_size > 0) << 20)
+                | (len(capture_ids) << 12)
+                | ((acc & 2) << 7)
+                | ((acc & 1) << 4)
+            )
+            return (history.get(move, 0), packed)
+
+        ordered = sorted(moves, key=greedy_key, reverse=True)
+
+        # Killers for this ply jump the queue (most recent first), then the
+        # TT move takes the very front.
+        front: list[Move] = []
+        if ply is not None and ply < len(self._killers):
+            front = [m for m in self._killers[ply] if m is not None and m in moves]
+        if tt_move is not None and tt_move in moves and tt_move not in front:
+            front.insert(0, tt_move)
+        elif tt_move is not None and tt_move in front:
+            front.remove(tt_move)
+            front.insert(0, tt_move)
+        if front:
+            ordered = front + [m for m in ordered if m not in front]
+        return ordered
+
+    # ── Evaluation ────────────────────────────────────────────────────────────
+
+    def _terminal_value(self, engine: ScopaEngine, state: GameState) -> int:
+        """Exact round-score differential from the mover's perspective."""
+        final = engine.calculate_round_score(state)
+        me = state.current_player.id
+        my_score = final.scores[me]
+        opp_score = sum(v for pid, v in final.scores.items() if pid != me)
+        return _POINT * (my_score - opp_score)
+
+    @staticmethod
+    def _evaluate(state: GameState) -> int:
+        """
+        Static heuristic for depth-cutoff positions, from the mover's
+        perspective.  See the module docstring for the weight rationale.
+        """
+        totals: dict[str, int] = {}
+        for p in state.players:
+            coins = 0
+            sette = False
+            for c in p.captured:
+                if c.suit == _COINS_SUIT:
+                    coins += 1
+                    if c.value == _SETTEBELLO:
+                        sette = True
+            totals[p.id] = (
+                _W_SCOPA * p.scopas
+                + _W_CARD * len(p.captured)
+                + _W_COIN * coins
+                + (_W_SETTE if sette else 0)
+            )
+        me = state.current_player.id
+        my_total = totals[me]
+        opp_total = sum(v for pid, v in totals.items() if pid != me)
+        return my_total - opp_total
+
+    # ── Hashing ───────────────────────────────────────────────────────────────
+
+    def _tt_move(self, state: GameState) -> Optional[Move]:
+        """Best move cached for *state*, or ``None`` when not in the table."""
+        entry = self._tt.get(self._hash(state))
+        return entry[3] if entry is not None else None
+
+    def _hash(self, state: GameState) -> int:
+        """Zobrist hash of *state* (see :class:`_ZobristKeys`)."""
+        z = self._zobrist
+        key = z.key
+        h = 0
+        for c in state.table:
+            h ^= key(c.id, 0)
+        for i, p in enumerate(state.players):
+            hand_loc = 1 + i
+            cap_loc = 3 + i
+            for c in p.hand:
+                h ^= key(c.id, hand_loc)
+            for c in p.captured:
+                h ^= key(c.id, cap_loc)
+            h ^= z.scopa_key(i, p.scopas)
+        if state.current_player_index == 1:
+            h ^= z.turn_key
+        return h
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  MTD(f)
+# ════════════════════════════════════════════════════════════════════════════
+
+class MTDFAI(MinimaxAI):
+    """
+    MTD(f) driver over the same negamax core as :class:`MinimaxAI`.
+
+    Instead of one full-window alpha-beta pass per depth, each depth is
+    resolved by a sequence of *null-window* passes (``beta - 1, beta``).
+    A null-window search is maximally cheap — every node fails high or
+    low immediately — and each pass tightens a lower or upper bound on
+    the true minimax value until they meet.  The transposition table
+    makes re-visits between passes near-free, since the bound flags
+    stored by the previous pass answer most probes outright.
+
+    The first guess for each depth is the converged value of the
+    previous depth (and of the previous move for depth 1), which is
+    what makes MTD(f) converge in very few passes in practice.
+    """
+
+    __slots__ = ("_guess",)
+
+    def __init__(
+        self,
+        depth: int = 3,
+        time_budget: Optional[float] = None,
+        root_workers: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            depth=depth, time_budget=time_budget, root_workers=root_workers
+        )
+        self._guess: int = 0
+
+    def _search_root(
+        self,
+        engine: ScopaEngine,
+        state: GameState,
+        depth: int,
+        moves: list[Move],
+        pv_move: Optional[Move],
+    ) -> list[Move]:
+        """
+        Converge on the minimax value at *depth* with null-window passes.
+
+        Returns the root moves achieving the converged value; updates the
+        stored first guess for the next depth / move.
+        """
+        g = self._guess
+        lower, upper = -_INF, _INF
+        best_moves: list[Move] = []
+        while lower < upper:
+            beta = g + 1 if g == lower else g
+            g, passed_moves = self._root_pass(
+                engine, state, depth, moves, beta - 1, beta, pv_move
+            )
+            if g < beta:
+                upper = g
+            else:
+                lower = g
+                best_moves = passed_moves
+            if passed_moves:
+                pv_move = passed_moves[0]
+        # Converged from above without ever failing high: the last pass's
+        # principal move is the best move.
+        if not best_moves:
+            best_moves = passed_moves
+        self._guess = g
+        return best_moves
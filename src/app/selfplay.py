@@ -0,0 +1,129 @@
+"""
+src/app/selfplay.py
+===================
+Headless AI-vs-AI self-play for strategy strength evaluation.
+
+Rounds are fully independent (each has its own deck shuffle, RNG, and
+strategy instances), which makes self-play embarrassingly parallel: the
+driver fans rounds out across CPU cores with a ``ProcessPoolExecutor``
+and collects per-round results as they complete.
+
+Usage
+-----
+::
+
+    from src.app.selfplay import run_selfplay
+    from src.app import MinimaxAI
+
+    results = run_selfplay(1_000, seed_base=42,
+                           strategy_factory=lambda: MinimaxAI(depth=3))
+    total = sum(r["scores"]["P1"] for r in results)
+
+``strategy_factory`` must be picklable (a class or module-level callable)
+because it is shipped to worker processes.  Each worker builds fresh
+strategy instances per round, so strategies never share mutable state
+across rounds.
+
+Determinism
+-----------
+Round *n* seeds both the deck shuffle and the shared move RNG with
+``seed_base + n`` — the same convention as ``GameSession`` and
+``src.simulation`` — so any interesting round can be replayed alone.
+"""
+
+from __future__ import annotations
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+from src.engine import ScopaEngine, loadDeck
+
+from .ai_player import AIStrategy, SimpleAI
+
+#: Fixed player identifiers used in every self-play round.
+PLAYER_IDS: list[str] = ["P1", "P2"]
+
+
+def _play_one_round(
+    round_number: int,
+    seed_base: int,
+    strategy_factory: Callable[[], AIStrategy],
+    deck_name: str,
+) -> dict:
+    """
+    Play one complete headless round and return its result summary.
+
+    Module-level (not a closure) so it can be pickled to worker processes.
+    """
+    seed = seed_base + round_number
+    move_rng = random.Random(seed)
+
+    import src.decks  # noqa: F401 — registers decks in worker processes too
+
+    engine = ScopaEngine()
+    cards = loadDeck(deck_name)
+    state = engine.create_game(cards, PLAYER_IDS, seed=seed)
+    strategies = {pid: strategy_factory() for pid in PLAYER_IDS}
+
+    total_moves = 0
+    while not engine.is_round_over(state):
+        state = engine.deal_if_needed(state)
+        pid = state.current_player.id
+        card_id, capture_ids = strategies[pid].choose_move(
+            engine, state, pid, move_rng
+        )
+        state = engine.play_card(state, pid, card_id, capture_ids)
+        state = engine.deal_if_needed(state)
+        total_moves += 1
+
+    final = engine.calculate_round_score(state)
+    return {
+        "round_number": round_number,
+        "scores":       dict(final.scores),
+        "scopas":       {p.id: p.scopas for p in final.players},
+        "total_moves":  total_moves,
+    }
+
+
+def run_selfplay(
+    n_rounds: int,
+    seed_base: int = 42,
+    strategy_factory: Callable[[], AIStrategy] = SimpleAI,
+    deck_name: str = "napolitane",
+    n_workers: Optional[int] = None,
+) -> list[dict]:
+    """
+    Play *n_rounds* of AI-vs-AI Scopa across worker processes.
+
+    Parameters
+    ----------
+    n_rounds:
+        Rounds to play (round numbers ``1 … n_rounds``).
+    seed_base:
+        Base seed; round *n* uses ``seed_base + n``.
+    strategy_factory:
+        Picklable zero-argument callable producing an ``AIStrategy``; both
+        players use the same factory.  Defaults to ``SimpleAI``.
+    deck_name:
+        Registered deck to play with.
+    n_workers:
+        Worker process count.  ``None`` lets the executor use one per CPU;
+        ``1`` is useful for debugging (still runs in a subprocess).
+
+    Returns
+    -------
+    list[dict]
+        One result dict per round, ordered by round number, each holding
+        ``round_number``, ``scores``, ``scopas``, and ``total_moves``.
+    """
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(
+            executor.map(
+                _play_one_round,
+                range(1, n_rounds + 1),
+                (seed_base for _ in range(n_rounds)),
+                (strategy_factory for _ in range(n_rounds)),
+                (deck_name for _ in range(n_rounds)),
+            )
+        )
@@ -17,6 +17,14 @@ Three serialization tiers
    Wraps the full state with session-level metadata (round history,
    cumulative scores, player IDs).  The top-level persistence format.
 
+4. **Binary state** (``serialize_game_state_binary`` /
+   ``deserialize_game_state_binary``)
+   Compact ``bytes`` encoding of a full ``GameState`` for high-frequency
+   persistence (autosave, Redis, WebSocket sync).  Each distinct card is
+   written once in a header string table; every pile entry afterwards is a
+   single index byte, so a snapshot is a few hundred bytes instead of the
+   multi-KB JSON dict — and no per-card dicts are allocated at all.
+
 Notes
 -----
 * ``Card.image_url`` is preserved so the rendering layer can resume without
@@ -33,16 +41,31 @@ Notes
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import json
+import pickle
+import struct
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+try:  # optional accelerator — stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.engine import Card
-from src.engine.scopa import GameConfig, GameState, PlayerState
+from src.engine.scopa import _DEFAULT_CONFIG, GameState, PlayerState
 
 if TYPE_CHECKING:
     from .game_session import GameSession  # type-hints only, no runtime import
 
 _SNAPSHOT_VERSION = "1.0"
 
+#: Format tag of the pickle fast path (see ``export_game_state_pickle``).
+_PICKLE_FORMAT = "pickle-v1"
+
+#: Compact JSON encoder used by the streaming export path.
+_dumps = partial(json.dumps, separators=(",", ":"))
+
 
 # ════════════════════════════════════════════════════════════════════════════
 #  Card
@@ -57,13 +80,45 @@ def _serialize_card(card: Card) -> dict[str, Any]:
     }
 
 
-def _deserialize_card(data: dict[str, Any]) -> Card:
-    return Card(
-        id=data["id"],
-        suit=data["suit"],
-        value=int(data["value"]),
-        image_url=data.get("image_url", ""),
-    )
+def _serialize_card_tuple(card: Card) -> tuple[str, str, int, str]:
+    """
+    Tuple fast path for the full-state (non-UI) tier: ``(id, suit, value,
+    image_url)``.  A tuple is markedly smaller than the equivalent dict and
+    skips per-card hash-table setup, which adds up across deck + table +
+    captured piles on every export.  Encodes to a JSON array.
+    """
+    return (card.id, card.suit, card.value, card.image_url)
+
+
+#: Interning table for deserialised cards.  Card ids are globally unique
+#: (``"{deck}::{suit}::{value}"``) and Card is frozen, so every snapshot
+#: restore can share one instance per id instead of allocating a fresh
+#: Card per deck/table/hand/captured entry on every load.
+_CARD_INTERN: dict[str, Card] = {}
+
+
+def _deserialize_card(data: Any) -> Card:
+    # Accepts both encodings: the 4-element sequence written by current
+    # full-state exports and the {key: value} dict of older snapshots
+    # (still used by the public tier, which never round-trips).
+    if isinstance(data, dict):
+        card_id = data["id"]
+        card = _CARD_INTERN.get(card_id)
+        if card is None:
+            card = _CARD_INTERN[card_id] = Card(
+                id=card_id,
+                suit=data["suit"],
+                value=int(data["value"]),
+                image_url=data.get("image_url", ""),
+            )
+        return card
+    card_id, suit, value, image_url = data
+    card = _CARD_INTERN.get(card_id)
+    if card is None:
+        card = _CARD_INTERN[card_id] = Card(
+            id=card_id, suit=suit, value=int(value), image_url=image_url
+        )
+    return card
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -73,8 +128,8 @@ def _deserialize_card(data: dict[str, Any]) -> Card:
 def _serialize_player(player: PlayerState) -> dict[str, Any]:
     return {
         "id":       player.id,
-        "hand":     [_serialize_card(c) for c in player.hand],
-        "captured": [_serialize_card(c) for c in player.captured],
+        "hand":     [_serialize_card_tuple(c) for c in player.hand],
+        "captured": [_serialize_card_tuple(c) for c in player.captured],
         "scopas":   player.scopas,
     }
 
@@ -100,8 +155,8 @@ def serialize_game_state(state: GameState) -> dict[str, Any]:
     ``deserialize_game_state``.  See module docstring for rationale.
     """
     return {
-        "deck":                    [_serialize_card(c) for c in state.deck],
-        "table":                   [_serialize_card(c) for c in state.table],
+        "deck":                    [_serialize_card_tuple(c) for c in state.deck],
+        "table":                   [_serialize_card_tuple(c) for c in state.table],
         "players":                 [_serialize_player(p) for p in state.players],
         "current_player_index":    state.current_player_index,
         "last_capture_player_id":  state.last_capture_player_id,
@@ -117,7 +172,7 @@ def deserialize_game_state(data: dict[str, Any]) -> GameState:
     A fresh ``GameConfig()`` is applied.  Extend this function if custom
     configs need to be round-tripped.
     """
-    return GameState(
+    state = GameState(
         deck=                   [_deserialize_card(c) for c in data["deck"]],
         table=                  [_deserialize_card(c) for c in data["table"]],
         players=                [_deserialize_player(p) for p in data["players"]],
@@ -125,8 +180,175 @@ def deserialize_game_state(data: dict[str, Any]) -> GameState:
         last_capture_player_id= data["last_capture_player_id"],
         scores=                 {k: int(v) for k, v in data["scores"].items()},
         phase=                  data["phase"],
-        config=                 GameConfig(),
+        config=                 _DEFAULT_CONFIG,
+    )
+    state.zobrist = state.compute_zobrist()
+    for p in state.players:
+        p.refresh_capture_counters(state.config)
+    return state
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  Binary game state (compact, lossless)
+# ════════════════════════════════════════════════════════════════════════════
+
+#: Magic + format version.  Bump the digit on any layout change.
+_BINARY_MAGIC = b"SCB1"
+
+_U8  = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_I32 = struct.Struct("<i")
+
+#: Sentinel index for "no player" (``last_capture_player_id is None``).
+_NO_PLAYER = 0xFF
+
+
+def _pack_str(buf: bytearray, text: str) -> None:
+    data = text.encode("utf-8")
+    buf += _U16.pack(len(data))
+    buf += data
+
+
+def _unpack_str(data: bytes, pos: int) -> tuple[str, int]:
+    (length,) = _U16.unpack_from(data, pos)
+    pos += 2
+    return data[pos:pos + length].decode("utf-8"), pos + length
+
+
+def serialize_game_state_binary(state: GameState) -> bytes:
+    """
+    Encode *state* as compact ``bytes``.
+
+    Layout (all little-endian):
+
+    * magic ``SCB1``
+    * card table — every distinct card once: id, suit, image_url
+      (length-prefixed UTF-8) + value byte
+    * player table — player ids
+    * piles (deck, table, then per player hand + captured) as
+      length-prefixed sequences of card-table index bytes
+    * scalars — scopas, current player, last capturer, scores, phase
+
+    Cards appear once in the header; each pile entry afterwards costs one
+    byte.  Round-trips losslessly through
+    :func:`deserialize_game_state_binary` (``GameConfig`` excluded, as in
+    the JSON tier).
+    """
+    cards: list[Card] = [*state.deck, *state.table]
+    for p in state.players:
+        cards += p.hand
+        cards += p.captured
+    index = {card.id: i for i, card in enumerate(cards)}
+
+    buf = bytearray(_BINARY_MAGIC)
+    buf += _U8.pack(len(cards))
+    for card in cards:
+        _pack_str(buf, card.id)
+        _pack_str(buf, card.suit)
+        _pack_str(buf, card.image_url)
+        buf += _U8.pack(card.value)
+
+    buf += _U8.pack(len(state.players))
+    for p in state.players:
+        _pack_str(buf, p.id)
+
+    def pack_pile(pile: list[Card]) -> None:
+        buf.append(len(pile))
+        buf.extend(index[c.id] for c in pile)
+
+    pack_pile(state.deck)
+    pack_pile(state.table)
+    for p in state.players:
+        pack_pile(p.hand)
+        pack_pile(p.captured)
+        buf += _U8.pack(p.scopas)
+
+    buf += _U8.pack(state.current_player_index)
+    if state.last_capture_player_id is None:
+        buf += _U8.pack(_NO_PLAYER)
+    else:
+        capturer = next(
+            i for i, p in enumerate(state.players)
+            if p.id == state.last_capture_player_id
+        )
+        buf += _U8.pack(capturer)
+    for p in state.players:
+        buf += _I32.pack(state.scores.get(p.id, 0))
+    _pack_str(buf, state.phase)
+    return bytes(buf)
+
+
+def deserialize_game_state_binary(data: bytes) -> GameState:
+    """
+    Reconstruct a ``GameState`` from :func:`serialize_game_state_binary`
+    output.  A fresh ``GameConfig()`` is applied, as in the JSON tier.
+    """
+    if data[:4] != _BINARY_MAGIC:
+        raise ValueError(
+            f"Not a Scopa binary snapshot (bad magic {data[:4]!r})."
+        )
+    pos = 4
+
+    n_cards = data[pos]; pos += 1
+    cards: list[Card] = []
+    for _ in range(n_cards):
+        card_id, pos   = _unpack_str(data, pos)
+        suit, pos      = _unpack_str(data, pos)
+        image_url, pos = _unpack_str(data, pos)
+        value = data[pos]; pos += 1
+        card = _CARD_INTERN.get(card_id)
+        if card is None:
+            card = _CARD_INTERN[card_id] = Card(
+                id=card_id, suit=suit, value=value, image_url=image_url
+            )
+        cards.append(card)
+
+    n_players = data[pos]; pos += 1
+    player_ids: list[str] = []
+    for _ in range(n_players):
+        pid, pos = _unpack_str(data, pos)
+        player_ids.append(pid)
+
+    def unpack_pile() -> list[Card]:
+        nonlocal pos
+        length = data[pos]; pos += 1
+        pile = [cards[i] for i in data[pos:pos + length]]
+        pos += length
+        return pile
+
+    deck  = unpack_pile()
+    table = unpack_pile()
+    players: list[PlayerState] = []
+    for pid in player_ids:
+        hand     = unpack_pile()
+        captured = unpack_pile()
+        scopas = data[pos]; pos += 1
+        players.append(PlayerState(id=pid, hand=hand, captured=captured, scopas=scopas))
+
+    current_player_index = data[pos]; pos += 1
+    capturer = data[pos]; pos += 1
+    scores: dict[str, int] = {}
+    for pid in player_ids:
+        (scores[pid],) = _I32.unpack_from(data, pos)
+        pos += 4
+    phase, pos = _unpack_str(data, pos)
+
+    state = GameState(
+        deck=deck,
+        table=table,
+        players=players,
+        current_player_index=current_player_index,
+        last_capture_player_id=(
+            None if capturer == _NO_PLAYER else player_ids[capturer]
+        ),
+        scores=scores,
+        phase=phase,
+        config=_DEFAULT_CONFIG,
     )
+    state.zobrist = state.compute_zobrist()
+    for p in state.players:
+        p.refresh_capture_counters(state.config)
+    return state
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -154,13 +376,9 @@ def serialize_public_state(
     * ``is_human_turn`` flag for simple UI branching.
     """
     human = state.player_by_id(human_player_id)
-    # During a round state.scores is always {pid: 0} until calculate_round_score
-    # is called at round end. Show live scopas count so the scoreboard reflects
-    # scopas immediately as they happen.
-    live_scores = {
-        p.id: state.scores.get(p.id, 0) + p.scopas
-        for p in state.players
-    }
+    # The engine maintains the scores + scopas view incrementally, so the
+    # scoreboard reflects scopas immediately without per-poll recompute.
+    live_scores = dict(state.live_scores)
     return {
         "phase":                  state.phase,
         "deck_remaining":         len(state.deck),
@@ -214,10 +432,107 @@ def export_game_state(session: Any) -> dict[str, Any]:
     }
 
 
-def load_game_state(data: dict[str, Any]) -> GameSession:
+def export_game_state_bytes(session: Any) -> bytes:
+    """
+    Serialise a ``GameSession`` snapshot straight to UTF-8 JSON ``bytes``.
+
+    The shortest path for persistence sinks that want bytes anyway (disk,
+    Redis, WebSocket frames).  Uses ``orjson`` when installed — a C
+    encoder several times faster than stdlib ``json`` on nested snapshots
+    — and falls back to ``json.dumps(...).encode()`` transparently.
+
+    Round-trips through ``load_game_state(json.loads(blob))``.
+    """
+    payload = export_game_state(session)
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return _dumps(payload).encode("utf-8")
+
+
+def export_game_state_pickle(session: Any) -> bytes:
+    """
+    Serialise a ``GameSession`` with ``pickle`` protocol 5 for the fastest
+    possible save/restore between **trusted** endpoints (local autosave,
+    same-trust-domain Redis).
+
+    ``load_game_state`` reconstructs the whole object graph — Cards,
+    PlayerStates, GameState — in one C-level pass instead of Python-walking
+    every dict.  Never feed untrusted bytes to the loader: unpickling
+    executes arbitrary code by design.  Use the JSON tier at trust
+    boundaries.
+    """
+    payload = {
+        "format":            _PICKLE_FORMAT,
+        "player_ids":        list(session.player_ids),
+        "deck_name":         session.deck_name,
+        "seed":              session.seed,
+        "round_number":      session.round_number,
+        "cumulative_scores": dict(session.cumulative_scores),
+        "round_history":     list(session.round_history),
+        "current_state":     session._state,
+    }
+    return pickle.dumps(payload, protocol=5)
+
+
+def _stream_game_state(state: GameState, fp: Any) -> None:
+    """
+    Write the :func:`serialize_game_state` encoding of *state* directly to
+    *fp* as JSON, one card at a time — the nested dict is never built.
+    """
+    write = fp.write
+    write('{"deck":[')
+    write(",".join(_dumps(_serialize_card_tuple(c)) for c in state.deck))
+    write('],"table":[')
+    write(",".join(_dumps(_serialize_card_tuple(c)) for c in state.table))
+    write('],"players":[')
+    for i, player in enumerate(state.players):
+        if i:
+            write(",")
+        write('{"id":%s,"hand":[' % _dumps(player.id))
+        write(",".join(_dumps(_serialize_card_tuple(c)) for c in player.hand))
+        write('],"captured":[')
+        write(",".join(_dumps(_serialize_card_tuple(c)) for c in player.captured))
+        write('],"scopas":%d}' % player.scopas)
+    write('],"current_player_index":%d' % state.current_player_index)
+    write(',"last_capture_player_id":%s' % _dumps(state.last_capture_player_id))
+    write(',"scores":%s' % _dumps(dict(state.scores)))
+    write(',"phase":%s}' % _dumps(state.phase))
+
+
+def export_game_state_stream(session: Any, fp: Any) -> None:
+    """
+    Write the :func:`export_game_state` snapshot of *session* directly to
+    the text file-like object *fp*.
+
+    Produces byte-identical JSON to ``json.dump(export_game_state(session),
+    fp, separators=(",", ":"))`` but never materialises the full nested
+    dict — peak extra memory stays O(1) regardless of state size, which
+    matters for frequent autosaves of long sessions.
+    """
+    write = fp.write
+    write('{"version":%s' % _dumps(_SNAPSHOT_VERSION))
+    write(',"player_ids":%s' % _dumps(list(session.player_ids)))
+    write(',"deck_name":%s' % _dumps(session.deck_name))
+    write(',"seed":%s' % _dumps(session.seed))
+    write(',"round_number":%d' % session.round_number)
+    write(',"cumulative_scores":%s' % _dumps(dict(session.cumulative_scores)))
+    write(',"round_history":[')
+    for i, entry in enumerate(session.round_history):
+        if i:
+            write(",")
+        write(_dumps(entry))
+    write('],"current_state":')
+    if session._state is None:
+        write("null")
+    else:
+        _stream_game_state(session._state, fp)
+    write("}")
+
+
+def load_game_state(data: Union[dict[str, Any], bytes]) -> GameSession:
     """
     Reconstruct a ``GameSession`` from a snapshot produced by
-    ``export_game_state``.
+    ``export_game_state`` (dict) or ``export_game_state_pickle`` (bytes).
 
     Supports snapshots at any phase — ``"playing"``, ``"finished"``, or
     before the first ``start_round()`` call (``current_state`` is ``None``).
@@ -225,15 +540,40 @@ def load_game_state(data: dict[str, Any]) -> GameSession:
     Parameters
     ----------
     data:
-        JSON-parsed ``dict`` from a previous ``export_game_state`` call.
+        JSON-parsed ``dict`` from a previous ``export_game_state`` call,
+        or the raw ``bytes`` of a pickle export (**trusted sources
+        only** — see ``export_game_state_pickle``).  Ownership transfers
+        to the session: ``round_history`` is adopted as-is (entries were
+        always shared with a shallow list copy), so don't mutate *data*
+        after restoring from it.
 
     Returns
     -------
     GameSession
         Fully restored session, ready to resume play.
+
+    Raises
+    ------
+    ValueError
+        If the snapshot's major version is newer than this code knows how
+        to read.
     """
     from .game_session import GameSession  # lazy import — breaks circular dep
 
+    if isinstance(data, (bytes, bytearray)):
+        data = pickle.loads(data)
+
+    fast_path = data.get("format") == _PICKLE_FORMAT
+    if not fast_path:
+        # Version gate: same-major snapshots are readable (minor bumps
+        # stay backward compatible); a newer major means an unknown layout.
+        version = str(data.get("version", _SNAPSHOT_VERSION))
+        if version.split(".")[0] != _SNAPSHOT_VERSION.split(".")[0]:
+            raise ValueError(
+                f"Unsupported snapshot version '{version}' "
+                f"(this build reads '{_SNAPSHOT_VERSION}')."
+            )
+
     session = GameSession(
         player_ids=list(data["player_ids"]),
         deck_name=data["deck_name"],
@@ -241,9 +581,15 @@ def load_game_state(data: dict[str, Any]) -> GameSession:
     )
     session._round_number     = int(data["round_number"])
     session.cumulative_scores = {k: int(v) for k, v in data["cumulative_scores"].items()}
-    session.round_history     = list(data["round_history"])
+    session.round_history     = data["round_history"]
 
     if data.get("current_state") is not None:
-        session._state = deserialize_game_state(data["current_state"])
+        # The pickle path already reconstructed the full GameState graph;
+        # only JSON snapshots need the Python-level walker.
+        session._state = (
+            data["current_state"]
+            if fast_path
+            else deserialize_game_state(data["current_state"])
+        )
 
     return session
@@ -5,8 +5,10 @@ Self-registering module for the traditional 40-card Neapolitan deck.
 
 How it works
 ------------
-Importing this module (or ``src.decks``) triggers the ``register()`` call at
-the bottom of this file.  After that, anywhere in the application you can do::
+Importing this module (or ``src.decks``) triggers the ``register_lazy()``
+call at the bottom of this file; the definition (and its ``metadata.json``
+read) is built on first use.  After that, anywhere in the application you
+can do::
 
     from src.engine import DeckRegistry, loadDeck
     cards = loadDeck("napolitane")
@@ -93,8 +95,9 @@ def _build_definition() -> DeckDefinition:
     )
 
 
-# ── Eager registration ────────────────────────────────────────────────────────
-# Runs once when this module is first imported.  Subsequent imports are
-# no-ops thanks to Python's module cache.
+# ── Lazy registration ─────────────────────────────────────────────────────────
+# Runs once when this module is first imported; the definition itself —
+# including the metadata.json read — is built on the first lookup, keeping
+# disk IO off the import graph.
 
-DeckRegistry.register(_build_definition())
+DeckRegistry.register_lazy(_DECK_NAME, _build_definition)
@@ -10,6 +10,11 @@ ScopaEngineError                  ← base; catch-all for engine errors
 ├── InvalidDeckDefinitionError    ← structural problem in a DeckDefinition
 ├── IncompleteDeckError           ← loaded deck has wrong card count
 └── MissingCardImageError         ← expected image file not found on disk
+
+Exceptions that carry structured fields format their message lazily in
+``__str__`` — callers that raise and catch them for control flow (registry
+probes, feature detection) pay only attribute assignment at construction
+time, never f-string work.
 """
 
 
@@ -31,14 +36,17 @@ class DeckNotFoundError(ScopaEngineError):
     """
 
     def __init__(self, name: str, available: list[str]) -> None:
-        display = available if available else ["(none registered)"]
-        super().__init__(
-            f"Deck '{name}' is not registered.  "
-            f"Available decks: {display}"
-        )
+        super().__init__()
         self.name = name
         self.available = available
 
+    def __str__(self) -> str:
+        display = self.available if self.available else ["(none registered)"]
+        return (
+            f"Deck '{self.name}' is not registered.  "
+            f"Available decks: {display}"
+        )
+
 
 class InvalidDeckDefinitionError(ScopaEngineError):
     """
@@ -64,14 +72,17 @@ class IncompleteDeckError(ScopaEngineError):
     """
 
     def __init__(self, name: str, expected: int, got: int) -> None:
-        super().__init__(
-            f"Deck '{name}' is incomplete: "
-            f"expected {expected} cards, got {got}."
-        )
+        super().__init__()
         self.name = name
         self.expected = expected
         self.got = got
 
+    def __str__(self) -> str:
+        return (
+            f"Deck '{self.name}' is incomplete: "
+            f"expected {self.expected} cards, got {self.got}."
+        )
+
 
 class MissingCardImageError(ScopaEngineError):
     """
@@ -85,9 +96,10 @@ class MissingCardImageError(ScopaEngineError):
     """
 
     def __init__(self, suit: str, value: int, url: str) -> None:
-        super().__init__(
-            f"Missing image for '{value} of {suit}': '{url}'"
-        )
+        super().__init__()
         self.suit = suit
         self.value = value
         self.url = url
+
+    def __str__(self) -> str:
+        return f"Missing image for '{self.value} of {self.suit}': '{self.url}'"
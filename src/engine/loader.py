@@ -37,11 +37,13 @@ exclusively to the rendering layer.
 
 from __future__ import annotations
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
 
 from .exceptions import IncompleteDeckError, MissingCardImageError
-from .models import Card
+from .models import SUIT_INDEX, Card
 from .registry import DeckRegistry
 
 
@@ -92,6 +94,30 @@ def loadDeck(
         If a required image file is missing on the local filesystem.
     IncompleteDeckError
         If the produced card list has a count other than 40 (logic guard).
+
+    Notes
+    -----
+    The built deck is cached per ``(deck_name, art_variant,
+    skip_image_validation)`` combination, so only the first load pays the
+    image-existence checks and Card construction; every later call (one
+    per ``start_round``) returns a fresh list over the same immutable
+    Card instances.
+    """
+    return list(_load_deck_cached(deck_name, art_variant, skip_image_validation))
+
+
+@lru_cache(maxsize=8)
+def _load_deck_cached(
+    deck_name: str,
+    art_variant: str,
+    skip_image_validation: bool,
+) -> tuple[Card, ...]:
+    """
+    Build (once) and cache the card tuple for a deck.
+
+    Returns a tuple so the cached value is immutable; :func:`loadDeck`
+    hands each caller a fresh list wrapper.  Sharing the Card instances
+    themselves is safe — they are frozen value objects.
     """
     definition = DeckRegistry.get(deck_name)  # raises DeckNotFoundError
 
@@ -104,25 +130,51 @@ def loadDeck(
     is_local = _is_local_path(definition.asset_path)
     validate_images = is_local and not skip_image_validation
 
-    cards: list[Card] = []
-
-    for suit in definition.suits:
-        for value in definition.values:
-            image_url = _build_image_url(
-                definition.asset_path, suit, value, art_variant
-            )
-
-            if validate_images:
-                _validate_local_image(image_url, suit, value)
-
-            cards.append(
-                Card(
-                    suit=suit,
-                    value=value,
-                    id=f"{deck_name}::{suit}::{value}",
-                    image_url=image_url,
-                )
-            )
+    # Everything invariant across the 40-card build is computed once: the
+    # normalised asset prefix, per-suit id/URL prefixes, the definition
+    # fields — the comprehension below then runs on locals only.
+    asset_path = definition.asset_path
+    base       = asset_path.rstrip("/")
+    prefix     = base if art_variant == "default" else f"{base}/{art_variant}"
+    values     = definition.values
+
+    # Interned suit strings make every Card of a suit share one object,
+    # which turns the hot suit == "oro" comparisons in scoring into
+    # pointer checks.
+    suits = [sys.intern(s) for s in definition.suits]
+
+    # Validation pre-pass, separated from construction: one scandir per
+    # suit directory replaces one stat() per card (4 getdents syscalls
+    # instead of 40 Path.is_file() probes), and the build comprehension
+    # stays pure CPU work.
+    if validate_images:
+        for suit in suits:
+            existing = _scan_suit_images(asset_path, suit, art_variant)
+            for value in values:
+                filename = f"{value}_{suit}.png"
+                if filename not in existing:
+                    raise MissingCardImageError(
+                        suit, value, f"{prefix}/{suit}/{filename}"
+                    )
+
+    id_prefix  = {s: f"{deck_name}::{s}::" for s in suits}
+    url_prefix = {s: f"{prefix}/{s}/" for s in suits}
+    suit_codes = {s: SUIT_INDEX.get(s, -1) for s in suits}
+    unchecked  = Card._unchecked
+
+    # _unchecked skips __post_init__: suit/value/id invariants are already
+    # guaranteed by the validated DeckDefinition.
+    cards = [
+        unchecked(
+            suit=suit,
+            value=value,
+            id=f"{id_prefix[suit]}{value}",
+            image_url=f"{url_prefix[suit]}{value}_{suit}.png",
+            suit_idx=suit_codes[suit],
+        )
+        for suit in suits
+        for value in values
+    ]
 
     # Integrity guard — should never fire if DeckDefinition was registered
     # correctly, but catches any future discrepancy between definition and loop.
@@ -131,7 +183,7 @@ def loadDeck(
             deck_name, definition.expected_card_count, len(cards)
         )
 
-    return cards
+    return tuple(cards)
 
 
 # ── Private helpers ───────────────────────────────────────────────────────────
@@ -164,6 +216,10 @@ def _build_image_url(
         Card identity.
     art_variant:
         Active artwork variant key.
+
+    The deck-build loop inlines this formula with its invariant parts
+    hoisted; this helper remains the canonical single-card form for
+    external callers.
     """
     base = asset_path.rstrip("/")
     filename = f"{value}_{suit}.png"
@@ -174,6 +230,33 @@ def _build_image_url(
     return f"{base}/{art_variant}/{suit}/{filename}"
 
 
+def _scan_suit_images(
+    asset_path: str,
+    suit: str,
+    art_variant: str,
+) -> set[str]:
+    """
+    Return the set of filenames present in one suit's asset directory.
+
+    A missing or unreadable directory yields an empty set — every card of
+    that suit then fails the membership test and raises
+    :class:`~src.engine.exceptions.MissingCardImageError` with its own
+    resolved URL, matching the per-file validation behaviour.
+    """
+    base = asset_path.rstrip("/")
+    if base.startswith("file://"):
+        base = base[7:]
+    directory = Path(base)
+    if art_variant != "default":
+        directory = directory / art_variant
+    directory = directory / suit
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name for e in entries if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def _is_local_path(asset_path: str) -> bool:
     """
     Return ``True`` when *asset_path* refers to a local filesystem path.
@@ -181,9 +264,13 @@ def _is_local_path(asset_path: str) -> bool:
     A path is considered local when its URL scheme is ``""`` (no scheme) or
     ``"file"``.  Anything else (``http``, ``https``, ``s3``, …) is treated
     as a remote URL and skips filesystem validation.
+
+    Implemented as a plain ``"://"`` scan — the full ``urlparse`` state
+    machine (and its tuple of substrings) is overkill for a scheme test on
+    every load.
     """
-    scheme = urlparse(asset_path).scheme
-    return scheme in ("", "file")
+    i = asset_path.find("://")
+    return i < 0 or asset_path[:i] == "file"
 
 
 def _validate_local_image(url: str, suit: str, value: int) -> None:
@@ -191,8 +278,10 @@ def _validate_local_image(url: str, suit: str, value: int) -> None:
     Raise :class:`~src.engine.exceptions.MissingCardImageError` when the
     file at *url* does not exist on the local filesystem.
 
-    Handles both plain paths and ``file://`` URIs.
+    Handles both plain paths and ``file://`` URIs.  Works on the raw
+    string via :func:`os.path.isfile` — a ``Path`` object per card is
+    needless churn when all we want is the underlying ``stat``.
     """
-    path = Path(url[7:]) if url.startswith("file://") else Path(url)
-    if not path.is_file():
+    p = url[7:] if url.startswith("file://") else url
+    if not os.path.isfile(p):
         raise MissingCardImageError(suit, value, url)
@@ -32,10 +32,23 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from stat import S_ISREG
 from typing import Optional
 
 from .models import DeckMetadata
 
+#: Parsed metadata keyed by file path, tagged with the mtime (ns) it was
+#: read at.  A changed file on disk invalidates its entry automatically.
+#: A :data:`_ABSENT` entry records a known-missing file so repeat calls
+#: skip even the stat syscall.
+_META_CACHE: dict[str, tuple[int, Optional[DeckMetadata]]] = {}
+
+#: Sentinel cache entry for paths whose metadata.json was absent.  Unlike
+#: mtime-tagged hits it never self-invalidates — call
+#: ``load_metadata.cache_clear()`` after dropping a metadata file next to
+#: an already-probed deck.
+_ABSENT: tuple[int, None] = (-1, None)
+
 
 def load_metadata(deck_asset_path: str) -> Optional[DeckMetadata]:
     """
@@ -60,14 +73,39 @@ def load_metadata(deck_asset_path: str) -> Optional[DeckMetadata]:
     ValueError
         If the file exists but contains invalid JSON or is missing
         required keys (``display_name``, ``origin``, ``aspect_ratio``).
+
+    Notes
+    -----
+    Results are cached per file path, keyed by the file's ``st_mtime_ns``
+    — repeat calls (UI tooltips, re-registrations) cost one ``stat`` and
+    no JSON parse until the file actually changes on disk.  Safe because
+    :class:`DeckMetadata` is frozen.  Missing files are cached too (not
+    even the stat is repeated); ``load_metadata.cache_clear()`` forgets
+    everything if a metadata file is added at runtime.
     """
     path = Path(deck_asset_path) / "metadata.json"
+    key = str(path)
+    cached = _META_CACHE.get(key)
+    if cached is _ABSENT:
+        return None
 
-    if not path.is_file():
+    # One stat serves both the existence check and the cache key.
+    try:
+        st = path.stat()
+    except OSError:
+        _META_CACHE[key] = _ABSENT
         return None
+    if not S_ISREG(st.st_mode):
+        _META_CACHE[key] = _ABSENT
+        return None
+
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
 
+    # json.loads accepts bytes directly; read_text would decode the UTF-8
+    # into a str only for the parser to scan it all over again.
     try:
-        raw: dict = json.loads(path.read_text(encoding="utf-8"))
+        raw: dict = json.loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise ValueError(
             f"Invalid JSON in '{path}': {exc}"
@@ -79,12 +117,14 @@ def load_metadata(deck_asset_path: str) -> Optional[DeckMetadata]:
         )
 
     # ── Required keys ─────────────────────────────────────────────────────────
-    required = {"display_name", "origin", "aspect_ratio"}
-    missing = required - raw.keys()
+    # Three direct membership tests — no set difference on the success path,
+    # and the fixed order keeps the error message deterministic.
+    missing = [
+        k for k in ("aspect_ratio", "display_name", "origin") if k not in raw
+    ]
     if missing:
         raise ValueError(
-            f"metadata.json at '{path}' is missing required keys: "
-            f"{sorted(missing)}"
+            f"metadata.json at '{path}' is missing required keys: {missing}"
         )
 
     # ── Type coercions ────────────────────────────────────────────────────────
@@ -96,10 +136,17 @@ def load_metadata(deck_asset_path: str) -> Optional[DeckMetadata]:
             f"got {raw['aspect_ratio']!r}."
         ) from exc
 
-    return DeckMetadata(
+    metadata = DeckMetadata(
         display_name=str(raw["display_name"]),
         origin=str(raw["origin"]),
         aspect_ratio=aspect_ratio,
         artwork_variant=str(raw.get("artwork_variant", "default")),
         description=str(raw.get("description", "")),
     )
+    _META_CACHE[key] = (st.st_mtime_ns, metadata)
+    return metadata
+
+
+# lru_cache-style escape hatch (load_metadata used to be @lru_cache-wrapped,
+# so existing call sites may already use this spelling).
+load_metadata.cache_clear = _META_CACHE.clear  # type: ignore[attr-defined]
@@ -16,7 +16,7 @@ branch on it.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -28,10 +28,15 @@ NAPOLITANE_SUITS: tuple[str, ...] = ("bastoni", "coppe", "oro", "spade")
 #: Standard Italian deck values — 1 (asso) through 10 (re).
 STANDARD_VALUES: tuple[int, ...] = tuple(range(1, 11))
 
+#: Canonical suit → small-int index (0..3), in NAPOLITANE_SUITS order.
+#: Hot engine loops compare and index by these ints instead of hashing
+#: suit strings; non-canonical suits map to ``-1``.
+SUIT_INDEX: dict[str, int] = {s: i for i, s in enumerate(NAPOLITANE_SUITS)}
+
 
 # ── Core game model ───────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Card:
     """
     Immutable representation of a single playing card.
@@ -40,6 +45,10 @@ class Card:
     ``image_url`` is populated at load-time and is intentionally opaque to
     game logic — treat it as a rendering attachment, *not* a game dependency.
 
+    Slotted: a full game keeps 40 of these alive and copies references
+    constantly, so dropping the per-instance ``__dict__`` keeps them lean
+    and attribute reads cheap.
+
     Attributes
     ----------
     suit:
@@ -52,12 +61,17 @@ class Card:
     image_url:
         Filesystem path or HTTP URL to the card face image.
         Empty string when a card is created outside a load context.
+    suit_idx:
+        Small-int suit code from :data:`SUIT_INDEX` (``-1`` for suits
+        outside the canonical four).  Derived automatically — engine
+        scoring loops compare this instead of the suit string.
     """
 
     suit: str
     value: int
     id: str
     image_url: str = ""
+    suit_idx: int = field(default=-1, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.suit:
@@ -68,6 +82,38 @@ class Card:
             )
         if not self.id:
             raise ValueError("Card.id cannot be empty.")
+        if self.suit_idx < 0:
+            object.__setattr__(self, "suit_idx", SUIT_INDEX.get(self.suit, -1))
+
+    # ── Construction ──────────────────────────────────────────────────────────
+
+    @classmethod
+    def _unchecked(
+        cls,
+        suit: str,
+        value: int,
+        id: str,
+        image_url: str,
+        suit_idx: int = -1,
+    ) -> Card:
+        """
+        Build a Card without running ``__post_init__`` validation.
+
+        Reserved for the deck loader, which constructs every card from an
+        already-validated :class:`DeckDefinition` — re-checking each of the
+        40 cards would validate the same invariants a second time.  The
+        loader passes the precomputed *suit_idx*; other callers may omit
+        it.  External callers must use the normal ``Card(...)`` constructor.
+        """
+        card = object.__new__(cls)
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, "value", value)
+        object.__setattr__(card, "id", id)
+        object.__setattr__(card, "image_url", image_url)
+        if suit_idx < 0:
+            suit_idx = SUIT_INDEX.get(suit, -1)
+        object.__setattr__(card, "suit_idx", suit_idx)
+        return card
 
     # ── Convenience ───────────────────────────────────────────────────────────
 
@@ -80,7 +126,7 @@ class Card:
 
 # ── Deck metadata (hydrated from metadata.json) ───────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeckMetadata:
     """
     Rich, human-readable descriptor for a deck.
@@ -125,7 +171,7 @@ class DeckMetadata:
 
 # ── Deck definition ───────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeckDefinition:
     """
     Blueprint that describes a complete deck to the loader.
@@ -165,9 +211,12 @@ class DeckDefinition:
     art_variants: tuple[str, ...] = ("default",)
     metadata: Optional[DeckMetadata] = None
 
-    # ── Derived helpers ───────────────────────────────────────────────────────
+    #: Total cards this definition should produce: ``len(suits) × len(values)``.
+    #: Derived once at construction — suits/values are frozen tuples, so the
+    #: product can never change afterwards.
+    expected_card_count: int = field(init=False, repr=False, compare=False, default=0)
 
-    @property
-    def expected_card_count(self) -> int:
-        """Total cards this definition should produce: ``len(suits) × len(values)``."""
-        return len(self.suits) * len(self.values)
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "expected_card_count", len(self.suits) * len(self.values)
+        )
@@ -5,14 +5,17 @@ Central registry for all deck definitions.
 
 Design
 ------
-``DeckRegistry`` is a *class-level* (singleton-style) store — no instance is
-ever needed.  Deck modules register themselves on import, so the caller only
-has to ``import src.decks.napolitane`` (or ``from src.decks import *``) and the
+The registry state lives in *module-level* dicts operated on by free
+functions — a module is already a singleton, and free functions skip the
+classmethod descriptor machinery on every call.  ``DeckRegistry`` remains
+the public facade (all existing call sites keep working); deck modules
+register themselves on import, so the caller only has to
+``import src.decks.napolitane`` (or ``from src.decks import *``) and the
 deck becomes available everywhere.
 
 Thread safety
 -------------
-The registry mutates a class-level dict.  For a single-threaded game process
+The registry mutates module-level dicts.  For a single-threaded game process
 this is fine.  If you ever add networking / hot-reload, wrap ``register`` /
 ``unregister`` with a ``threading.Lock``.
 
@@ -29,20 +32,191 @@ Usage
 
 from __future__ import annotations
 
-from .models import DeckDefinition
+from collections import Counter
+from typing import Callable, Optional
+
+from .models import NAPOLITANE_SUITS, STANDARD_VALUES, DeckDefinition
 from .exceptions import DeckNotFoundError, InvalidDeckDefinitionError
 
 _REQUIRED_CARD_COUNT: int = 40
 
+#: The registry proper, keyed by deck name.
+_DECKS: dict[str, DeckDefinition] = {}
+
+#: Deferred builders registered via ``register_lazy``, keyed by deck name.
+#: A builder is popped and materialised on first lookup.
+_LAZY: dict[str, Callable[[], DeckDefinition]] = {}
+
+#: Cached ``list_decks`` snapshot; dropped on every mutation so repeat
+#: listings (error messages, UI polling) cost one list copy.
+_NAMES_SNAPSHOT: Optional[tuple[str, ...]] = None
+
+
+# ── Registration ──────────────────────────────────────────────────────────────
+
+def _register(deck: DeckDefinition) -> None:
+    _validate_definition(deck)
+    _LAZY.pop(deck.name, None)
+    _DECKS[deck.name] = deck
+    _invalidate_caches()
+
+
+def _register_lazy(name: str, builder: Callable[[], DeckDefinition]) -> None:
+    _LAZY[name] = builder
+    _invalidate_caches()
+
+
+def _unregister(name: str) -> None:
+    _DECKS.pop(name, None)
+    _LAZY.pop(name, None)
+    _invalidate_caches()
+
+
+def _clear() -> None:
+    _DECKS.clear()
+    _LAZY.clear()
+    _invalidate_caches()
+
+
+def _invalidate_caches() -> None:
+    """
+    Drop loadDeck's built-deck cache and the name snapshot whenever the
+    registry changes, so a re-registration under an existing name can
+    never serve stale cards or a stale listing.  Imported lazily — the
+    loader imports this module at the top level.
+    """
+    global _NAMES_SNAPSHOT
+
+    from .loader import _load_deck_cached  # local import breaks the cycle
+
+    _load_deck_cached.cache_clear()
+    _NAMES_SNAPSHOT = None
+
+
+# ── Lookup ────────────────────────────────────────────────────────────────────
+
+def _get(name: str) -> DeckDefinition:
+    deck = _DECKS.get(name)
+    if deck is not None:
+        return deck
+    builder = _LAZY.pop(name, None)
+    if builder is not None:
+        deck = builder()
+        _register(deck)
+        return deck
+    raise DeckNotFoundError(name, _list_decks())
+
+
+def _list_decks() -> list[str]:
+    global _NAMES_SNAPSHOT
+
+    snap = _NAMES_SNAPSHOT
+    if snap is None:
+        snap = _NAMES_SNAPSHOT = tuple(_DECKS) + tuple(
+            n for n in _LAZY if n not in _DECKS
+        )
+    return list(snap)
+
+
+def _is_registered(name: str) -> bool:
+    return name in _DECKS or name in _LAZY
+
+
+# ── Validation ────────────────────────────────────────────────────────────────
+
+def _validate_definition(deck: DeckDefinition) -> None:
+    """
+    Accumulate all constraint violations and raise a single
+    :class:`~src.engine.exceptions.InvalidDeckDefinitionError` listing all
+    of them, so the developer can fix everything in one pass.
+
+    Constraints
+    -----------
+    * ``name`` must be a non-empty string.
+    * ``suits`` must have no duplicates.
+    * ``values`` must have no duplicates.
+    * ``len(suits) × len(values)`` must equal exactly 40.
+    * ``asset_path`` must be a non-empty string.
+    * Every declared ``art_variant`` must be a non-empty string.
+    * ``"default"`` must be present in ``art_variants``.
+    """
+    errors: list[str] = []
+
+    # Blank checks use str.isspace() rather than .strip() so the common
+    # all-valid path never allocates stripped copies of the fields.
+
+    # Name
+    if not deck.name or deck.name.isspace():
+        errors.append("Deck name cannot be empty.")
+
+    # Decks built from the canonical tuples in models.py share the exact
+    # singleton objects, so an identity check proves the suit/value
+    # constraints without re-counting anything.
+    canonical = (
+        deck.suits is NAPOLITANE_SUITS and deck.values is STANDARD_VALUES
+    )
+
+    if not canonical:
+        # Suits — one Counter pass both detects and names the duplicates,
+        # instead of a set comparison followed by an O(n²) count() scan.
+        dupes = [s for s, n in Counter(deck.suits).items() if n > 1]
+        if dupes:
+            errors.append(f"Duplicate suits detected: {sorted(dupes)}.")
+
+        # Values
+        dupes = [v for v, n in Counter(deck.values).items() if n > 1]
+        if dupes:
+            errors.append(f"Duplicate values detected: {sorted(dupes)}.")
+
+        # Card count
+        count = deck.expected_card_count
+        if count != _REQUIRED_CARD_COUNT:
+            errors.append(
+                f"Deck must define exactly {_REQUIRED_CARD_COUNT} cards "
+                f"({len(deck.suits)} suits × {len(deck.values)} values = {count})."
+            )
+
+    # Asset path
+    if not deck.asset_path or deck.asset_path.isspace():
+        errors.append("asset_path cannot be empty.")
+
+    # Art variants
+    if not deck.art_variants:
+        errors.append("art_variants must contain at least one entry.")
+    else:
+        if "default" not in deck.art_variants:
+            errors.append(
+                "'default' must be listed in art_variants "
+                "(it is the canonical asset layout)."
+            )
+        # any() fast-path: the bad-entry list is only built when the
+        # rare failure branch actually fires.
+        if any(not v or v.isspace() for v in deck.art_variants):
+            bad = [v for v in deck.art_variants if not v or v.isspace()]
+            errors.append(
+                f"art_variants contains empty or blank entries: {bad!r}."
+            )
+
+    if errors:
+        bullet_list = "\n".join(f"  • {e}" for e in errors)
+        raise InvalidDeckDefinitionError(
+            f"DeckDefinition '{deck.name}' failed validation:\n{bullet_list}"
+        )
+
+
+# ── Public facade ─────────────────────────────────────────────────────────────
 
 class DeckRegistry:
     """
-    Class-level store of :class:`~src.engine.models.DeckDefinition` objects.
+    Public facade over the module-level deck store.
 
-    All public methods are ``@classmethod``; never instantiate this class.
+    All public methods are ``@classmethod`` delegating to the free functions
+    above; never instantiate this class.  The underscore aliases keep code
+    (and tests) that introspected ``DeckRegistry._decks`` working.
     """
 
-    _decks: dict[str, DeckDefinition] = {}
+    _decks = _DECKS
+    _lazy = _LAZY
 
     # ── Registration ──────────────────────────────────────────────────────────
 
@@ -55,10 +229,27 @@ class DeckRegistry:
         ------
         InvalidDeckDefinitionError
             If any structural constraint is violated (see
-            :py:meth:`_validate_definition`).
+            :func:`_validate_definition`).
+        """
+        _register(deck)
+
+    @classmethod
+    def register_lazy(
+        cls,
+        name: str,
+        builder: Callable[[], DeckDefinition],
+    ) -> None:
+        """
+        Register *builder* to be invoked on first lookup of *name*.
+
+        Deck modules register at import time; building a definition may
+        touch the filesystem (``metadata.json``), which would put disk IO
+        on the import graph of every consumer.  A lazy registration defers
+        that work — validation included — to the first ``get`` / first
+        ``loadDeck``, after which the built definition is cached like an
+        eager one.
         """
-        cls._validate_definition(deck)
-        cls._decks[deck.name] = deck
+        _register_lazy(name, builder)
 
     @classmethod
     def unregister(cls, name: str) -> None:
@@ -67,12 +258,12 @@ class DeckRegistry:
 
         No-op if the name is not present (safe to call in teardown / tests).
         """
-        cls._decks.pop(name, None)
+        _unregister(name)
 
     @classmethod
     def clear(cls) -> None:
         """Remove **all** registered decks.  Primarily useful in test suites."""
-        cls._decks.clear()
+        _clear()
 
     # ── Lookup ────────────────────────────────────────────────────────────────
 
@@ -80,91 +271,33 @@ class DeckRegistry:
     def get(cls, name: str) -> DeckDefinition:
         """
         Return the :class:`~src.engine.models.DeckDefinition` registered under
-        *name*.
+        *name*, materialising a lazy registration on first hit.
 
         Raises
         ------
         DeckNotFoundError
             If *name* has not been registered.
+        InvalidDeckDefinitionError
+            If a lazy builder produces an invalid definition.
         """
-        if name not in cls._decks:
-            raise DeckNotFoundError(name, cls.list_decks())
-        return cls._decks[name]
+        return _get(name)
 
     @classmethod
     def list_decks(cls) -> list[str]:
-        """Return a snapshot of all registered deck names (insertion order)."""
-        return list(cls._decks.keys())
+        """
+        Return a snapshot of all registered deck names (insertion order,
+        lazy registrations included — they are *not* materialised).
+
+        The snapshot tuple is rebuilt only after a registry mutation;
+        every call still returns a fresh list the caller may mutate.
+        """
+        return _list_decks()
 
     @classmethod
     def is_registered(cls, name: str) -> bool:
         """Return ``True`` if *name* is currently in the registry."""
-        return name in cls._decks
-
-    # ── Validation ────────────────────────────────────────────────────────────
-
-    @classmethod
-    def _validate_definition(cls, deck: DeckDefinition) -> None:
-        """
-        Accumulate all constraint violations and raise a single
-        :class:`~src.engine.exceptions.InvalidDeckDefinitionError` listing all
-        of them, so the developer can fix everything in one pass.
-
-        Constraints
-        -----------
-        * ``name`` must be a non-empty string.
-        * ``suits`` must have no duplicates.
-        * ``values`` must have no duplicates.
-        * ``len(suits) × len(values)`` must equal exactly 40.
-        * ``asset_path`` must be a non-empty string.
-        * Every declared ``art_variant`` must be a non-empty string.
-        * ``"default"`` must be present in ``art_variants``.
-        """
-        errors: list[str] = []
-
-        # Name
-        if not deck.name or not deck.name.strip():
-            errors.append("Deck name cannot be empty.")
-
-        # Suits
-        if len(set(deck.suits)) != len(deck.suits):
-            dupes = [s for s in deck.suits if deck.suits.count(s) > 1]
-            errors.append(f"Duplicate suits detected: {sorted(set(dupes))}.")
-
-        # Values
-        if len(set(deck.values)) != len(deck.values):
-            dupes = [v for v in deck.values if deck.values.count(v) > 1]
-            errors.append(f"Duplicate values detected: {sorted(set(dupes))}.")
-
-        # Card count
-        count = deck.expected_card_count
-        if count != _REQUIRED_CARD_COUNT:
-            errors.append(
-                f"Deck must define exactly {_REQUIRED_CARD_COUNT} cards "
-                f"({len(deck.suits)} suits × {len(deck.values)} values = {count})."
-            )
+        return _is_registered(name)
 
-        # Asset path
-        if not deck.asset_path or not deck.asset_path.strip():
-            errors.append("asset_path cannot be empty.")
-
-        # Art variants
-        if not deck.art_variants:
-            errors.append("art_variants must contain at least one entry.")
-        else:
-            if "default" not in deck.art_variants:
-                errors.append(
-                    "'default' must be listed in art_variants "
-                    "(it is the canonical asset layout)."
-                )
-            bad = [v for v in deck.art_variants if not v or not v.strip()]
-            if bad:
-                errors.append(
-                    f"art_variants contains empty or blank entries: {bad!r}."
-                )
-
-        if errors:
-            bullet_list = "\n".join(f"  • {e}" for e in errors)
-            raise InvalidDeckDefinitionError(
-                f"DeckDefinition '{deck.name}' failed validation:\n{bullet_list}"
-            )
+    # Kept as a staticmethod so internal callers can keep writing
+    # ``DeckRegistry._validate_definition(deck)``.
+    _validate_definition = staticmethod(_validate_definition)
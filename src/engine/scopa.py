@@ -28,14 +28,14 @@ Exception hierarchy (new game-play exceptions, extends existing engine ones)
 
 from __future__ import annotations
 
-import copy
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from itertools import combinations
 from typing import Optional
 
 from .exceptions import ScopaEngineError
-from .models import Card
+from .models import SUIT_INDEX, Card
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -98,7 +98,7 @@ class EqualValuePriorityError(ScopaEngineError):
 #  Game configuration
 # ════════════════════════════════════════════════════════════════════════════
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameConfig:
     """
     Engine-level knobs.
@@ -132,19 +132,101 @@ class GameConfig:
         2: 12,
     })
 
+    #: Small-int code for ``coins_suit`` (see ``models.SUIT_INDEX``);
+    #: ``-1`` when the configured suit is non-canonical.  Derived once so
+    #: scoring loops compare card suit codes as ints.
+    coins_idx: int = field(init=False, repr=False, compare=False, default=-1)
+
+    #: ``primiera_values`` flattened into a rank-indexed tuple
+    #: (``primiera_table[value]``) — scoring loops index it directly
+    #: instead of hashing the rank through ``dict.get`` per card.
+    primiera_table: tuple[int, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "coins_idx", SUIT_INDEX.get(self.coins_suit, -1)
+        )
+        object.__setattr__(
+            self,
+            "primiera_table",
+            tuple(self.primiera_values.get(v, 10) for v in range(11)),
+        )
+
     def primiera_score(self, value: int) -> int:
         """Return the primiera point value for a card rank."""
-        return self.primiera_values.get(value, 10)
+        return self.primiera_table[value]
+
+
+#: Shared default configuration.  GameConfig is frozen, so every state
+#: that runs with stock rules can reference this one instance instead of
+#: allocating a fresh config (and primiera table) per construction —
+#: round restores and deserialised states in particular.
+_DEFAULT_CONFIG = GameConfig()
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  Zobrist hashing
+# ════════════════════════════════════════════════════════════════════════════
+
+class _ZobristKeys:
+    """
+    Lazily grown store of 64-bit Zobrist keys for state hashing.
+
+    A position hash is the XOR of one key per (card id, location) pair,
+    plus a side-to-move key and per-player scopa-count keys.  Keys are
+    drawn from a fixed-seed RNG so hashes are stable across processes and
+    runs — the same position always hashes the same.
+
+    Location codes: ``0`` table, ``1 + player_index`` hands,
+    ``3 + player_index`` captured piles, ``5`` deck.
+    """
+
+    __slots__ = ("_rng", "_keys", "turn_key")
+
+    _LOC_TABLE: int = 0
+    _LOC_HAND:  int = 1   # + player_index
+    _LOC_CAPT:  int = 3   # + player_index
+    _LOC_DECK:  int = 5
+
+    def __init__(self, seed: int = 0x5C07A) -> None:
+        self._rng: random.Random = random.Random(seed)
+        self._keys: dict[tuple[str, int], int] = {}
+        self.turn_key: int = self._rng.getrandbits(64)
+
+    def key(self, card_id: str, location: int) -> int:
+        """Return (creating on first use) the key for *card_id* at *location*."""
+        k = self._keys.get((card_id, location))
+        if k is None:
+            k = self._keys[(card_id, location)] = self._rng.getrandbits(64)
+        return k
+
+    def scopa_key(self, player_index: int, scopas: int) -> int:
+        """Key folding a player's scopa count into the hash (0 → identity)."""
+        if scopas == 0:
+            return 0
+        return self.key(f"scopa::{player_index}::{scopas}", -1)
+
+
+#: Process-wide key store.  Shared by every engine/state so hashes are
+#: comparable across sessions and usable as transposition-table keys.
+_Z = _ZobristKeys()
 
 
 # ════════════════════════════════════════════════════════════════════════════
 #  State dataclasses
 # ════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """
-    Mutable snapshot of a single player's state within one round.
+    Snapshot of a single player's state within one round.
+
+    Copy-on-write contract: the engine never mutates ``hand`` / ``captured``
+    in place once a state has been returned — a move builds a fresh
+    PlayerState (with fresh lists) for the acting player only, so the
+    non-acting player's object is shared between successive states.
 
     Attributes
     ----------
@@ -157,15 +239,36 @@ class PlayerState:
         the played card itself).
     scopas:
         Number of scopa events scored by this player this round.
+    coins_count / has_settebello / primiera_best:
+        Maintained scoring counters, folded forward by the engine as
+        cards enter ``captured`` so round-end scoring is O(players)
+        instead of re-scanning every captured pile.  ``primiera_best``
+        holds the best primiera value seen per canonical suit.
     """
 
     id: str
     hand: list[Card]
     captured: list[Card]
     scopas: int = 0
+    coins_count: int = 0
+    has_settebello: bool = False
+    primiera_best: tuple[int, int, int, int] = (0, 0, 0, 0)
 
+    def refresh_capture_counters(self, cfg: GameConfig) -> None:
+        """
+        Recompute the maintained counters from ``captured`` in full.
 
-@dataclass
+        For restore paths (deserialisation, hand-built test states) that
+        assemble a PlayerState without threading counters through moves.
+        """
+        (
+            self.coins_count,
+            self.has_settebello,
+            self.primiera_best,
+        ) = _fold_captured(0, False, (0, 0, 0, 0), self.captured, cfg)
+
+
+@dataclass(slots=True)
 class GameState:
     """
     Complete, serialisable snapshot of the game at any point in time.
@@ -191,10 +294,21 @@ class GameState:
         Cumulative *round* scores keyed by player id.  Reset to ``{}``
         at the start of each new round; the caller is responsible for
         accumulating across rounds.
+    live_scores:
+        Maintained ``scores + scopas`` view per player, updated by the
+        engine whenever either component changes.  Lets UI snapshots show
+        scopas as they happen without recomputing the sum on every poll.
     phase:
         Life-cycle marker: ``"playing"`` → ``"scoring"`` → ``"finished"``.
     config:
         Engine configuration snapshot baked into this state.
+    zobrist:
+        64-bit Zobrist hash of the position (card locations, scopa counts,
+        side to move).  Computed at game creation and maintained
+        incrementally by the engine on every move / deal, so callers get
+        an O(1) state key for caches and transposition tables.  Two states
+        with the same hash are (save for astronomically rare collisions)
+        the same position.
     """
 
     deck: list[Card]
@@ -204,7 +318,45 @@ class GameState:
     last_capture_player_id: Optional[str]
     scores: dict[str, int]
     phase: str  # "playing" | "scoring" | "finished"
-    config: GameConfig = field(default_factory=GameConfig)
+    config: GameConfig = field(default_factory=lambda: _DEFAULT_CONFIG)
+    zobrist: int = 0
+    live_scores: dict[str, int] = field(default_factory=dict)
+
+    # Declared as a field so the slots=True transform reserves a slot for
+    # it; always rebuilt in __post_init__, never passed by callers.
+    _players_by_id: dict[str, PlayerState] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    #: Lazily built ``card_id`` → ``Card`` index of the table, shared by
+    #: every query against this state (capture validation, AI helpers).
+    #: Never invalidated: a move that changes the table produces a fresh
+    #: GameState, so a cached index can only describe this state's table.
+    _table_by_id: Optional[dict[str, Card]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    #: Total cards currently held across all hands.  Derived on
+    #: construction (the engine builds a fresh state per move); the
+    #: in-place deal in ``_deal_initial`` refreshes it explicitly.
+    #: Lets ``is_round_over`` test two ints instead of walking hands.
+    hands_total: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        # States built without live_scores (older call sites, deserialise
+        # paths) get the maintained view derived on construction.
+        if not self.live_scores:
+            self.live_scores = {
+                p.id: self.scores.get(p.id, 0) + p.scopas
+                for p in self.players
+            }
+        # O(1) id → PlayerState index for the per-frame query helpers.
+        # The players list is never reassigned after construction, so the
+        # index stays valid for the state's lifetime.
+        self._players_by_id: dict[str, PlayerState] = {
+            p.id: p for p in self.players
+        }
+        self.hands_total = sum(len(p.hand) for p in self.players)
 
     # ── Derived helpers (read-only, never used in game logic) ─────────────────
 
@@ -215,10 +367,139 @@ class GameState:
 
     def player_by_id(self, player_id: str) -> PlayerState:
         """Return the :class:`PlayerState` for *player_id*."""
-        for p in self.players:
-            if p.id == player_id:
-                return p
-        raise KeyError(f"No player with id '{player_id}'.")
+        try:
+            return self._players_by_id[player_id]
+        except KeyError:
+            raise KeyError(f"No player with id '{player_id}'.") from None
+
+    def table_index(self) -> dict[str, Card]:
+        """
+        Return the ``card_id`` → :class:`Card` index of the current table.
+
+        Built on first access and reused for the state's lifetime, so
+        repeated queries (move validation plus AI capture enumeration on
+        the same position) scan the table once.
+        """
+        index = self._table_by_id
+        if index is None:
+            index = self._table_by_id = {c.id: c for c in self.table}
+        return index
+
+    def compute_zobrist(self) -> int:
+        """
+        Recompute the Zobrist hash of this state from scratch.
+
+        Used to (re)establish ``zobrist`` after game creation or a restore
+        from serialized form; the engine keeps it current incrementally
+        from then on.
+        """
+        key = _Z.key
+        h = 0
+        for c in self.deck:
+            h ^= key(c.id, _ZobristKeys._LOC_DECK)
+        for c in self.table:
+            h ^= key(c.id, _ZobristKeys._LOC_TABLE)
+        for i, p in enumerate(self.players):
+            hand_loc = _ZobristKeys._LOC_HAND + i
+            cap_loc = _ZobristKeys._LOC_CAPT + i
+            for c in p.hand:
+                h ^= key(c.id, hand_loc)
+            for c in p.captured:
+                h ^= key(c.id, cap_loc)
+            h ^= _Z.scopa_key(i, p.scopas)
+        if self.current_player_index == 1:
+            h ^= _Z.turn_key
+        return h
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  Capture counters
+# ════════════════════════════════════════════════════════════════════════════
+
+def _fold_captured(
+    coins: int,
+    settebello: bool,
+    best: tuple[int, int, int, int],
+    cards: list[Card],
+    cfg: GameConfig,
+) -> tuple[int, bool, tuple[int, int, int, int]]:
+    """
+    Fold *cards* into the maintained capture counters and return the
+    updated ``(coins, settebello, primiera_best)`` triple.
+
+    One pass per batch of newly captured cards keeps the running totals
+    that round scoring reads directly.  Suits are compared by their
+    small-int code; a non-canonical ``coins_suit`` falls back to name
+    comparison.
+    """
+    coins_idx = cfg.coins_idx
+    tbl = cfg.primiera_table
+    b = list(best)
+    if coins_idx >= 0:
+        for c in cards:
+            si = c.suit_idx
+            if si == coins_idx:
+                coins += 1
+                if c.value == 7:
+                    settebello = True
+            v = tbl[c.value]
+            if si >= 0 and v > b[si]:
+                b[si] = v
+    else:
+        coins_suit = cfg.coins_suit
+        for c in cards:
+            if c.suit == coins_suit:
+                coins += 1
+                if c.value == 7:
+                    settebello = True
+            v = tbl[c.value]
+            si = c.suit_idx
+            if si >= 0 and v > b[si]:
+                b[si] = v
+    return coins, settebello, (b[0], b[1], b[2], b[3])
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  Subset-sum index
+# ════════════════════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=256)
+def _table_sum_index(values: tuple[int, ...]) -> dict[int, tuple[int, ...]]:
+    """
+    Map each achievable capture sum to the table subsets producing it.
+
+    One bitmask DP pass over ``values`` (each mask's sum is its parent's
+    sum plus one card value) yields every subset sum; multi-card masks
+    summing to 10 or less — card values never exceed 10, so no playable
+    target can either — are bucketed per sum, ordered by size then
+    lexicographic index order to match direct enumeration.
+
+    Cached per distinct value tuple: an AI probing several targets
+    against the same table, or revisiting a transposed position, reuses
+    one index.  Callers must treat the returned dict as read-only.
+    """
+    n = len(values)
+    sums = [0] * (1 << n)
+    for i in range(n):
+        bit = 1 << i
+        v = values[i]
+        for mask in range(bit, bit << 1):
+            sums[mask] = sums[mask ^ bit] + v
+
+    buckets: dict[int, list[int]] = {}
+    for mask in range(3, 1 << n):
+        s = sums[mask]
+        if s <= 10 and mask & (mask - 1):
+            buckets.setdefault(s, []).append(mask)
+
+    for masks in buckets.values():
+        masks.sort(
+            key=lambda m: (
+                m.bit_count(),
+                tuple(i for i in range(n) if m >> i & 1),
+            )
+        )
+    return {s: tuple(masks) for s, masks in buckets.items()}
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -249,6 +530,10 @@ class ScopaEngine:
         state = engine.calculate_round_score(state)
     """
 
+    #: Largest table size handled by the bitmask subset-sum DP (2^n array);
+    #: bigger tables fall back to direct enumeration.
+    _SUBSET_DP_MAX: int = 16
+
     # ── Public API ────────────────────────────────────────────────────────────
 
     def create_game(
@@ -279,6 +564,35 @@ class ScopaEngine:
         seed:
             RNG seed for deterministic shuffle (tests / replays).
 
+        Raises
+        ------
+        ValueError
+            If ``len(player_ids) != 2`` or ``len(deck) != 40``.
+        """
+        shuffled = list(deck)
+        rng = random.Random(seed)
+        rng.shuffle(shuffled)
+        return self.create_game_from_order(shuffled, player_ids, config)
+
+    def create_game_from_order(
+        self,
+        deck: list[Card],
+        player_ids: list[str],
+        config: Optional[GameConfig] = None,
+    ) -> GameState:
+        """
+        Initialise a round from a deck in an *exact, caller-supplied* order.
+
+        No shuffle is applied: ``deck[0]`` is the first card dealt.  This is
+        the entry point for replaying a recorded deal or for search
+        harnesses that enumerate deck orders themselves and want to skip the
+        RNG entirely.  :py:meth:`create_game` is a thin shuffle-then-delegate
+        wrapper around this method.
+
+        The caller's list is never mutated — the initial deal slices fresh
+        lists off it, so later changes to the passed list cannot reach the
+        returned state.
+
         Raises
         ------
         ValueError
@@ -293,11 +607,7 @@ class ScopaEngine:
                 f"Deck must contain exactly 40 cards, got {len(deck)}."
             )
 
-        cfg = config or GameConfig()
-
-        shuffled = list(deck)
-        rng = random.Random(seed)
-        rng.shuffle(shuffled)
+        cfg = config or _DEFAULT_CONFIG
 
         players = [
             PlayerState(id=pid, hand=[], captured=[], scopas=0)
@@ -305,7 +615,7 @@ class ScopaEngine:
         ]
 
         state = GameState(
-            deck=shuffled,
+            deck=deck,
             table=[],
             players=players,
             current_player_index=0,
@@ -317,6 +627,7 @@ class ScopaEngine:
 
         # Deal initial hands + table cards
         state = self._deal_initial(state)
+        state.zobrist = state.compute_zobrist()
         return state
 
     def play_card(
@@ -358,44 +669,95 @@ class ScopaEngine:
         EqualValuePriorityError
             If the player attempts a sum capture when an exact match exists.
         """
-        state = self._deep_copy_state(state)
-
         # ── Turn validation ───────────────────────────────────────────────────
-        expected_id = state.current_player.id
-        if player_id != expected_id:
-            raise WrongTurnError(acting=player_id, expected=expected_id)
-
-        player = state.player_by_id(player_id)
+        # Validation runs against the input state; nothing is allocated
+        # until the move is known to be legal.
+        idx = state.current_player_index
+        player = state.players[idx]
+        if player_id != player.id:
+            raise WrongTurnError(acting=player_id, expected=player.id)
 
         # ── Find played card in hand ──────────────────────────────────────────
-        played_card = self._find_card_in_list(card_id, player.hand)
-        if played_card is None:
+        hand_idx = self._find_card_index(card_id, player.hand)
+        if hand_idx < 0:
             raise CardNotInHandError(card_id=card_id, player_id=player_id)
+        played_card = player.hand[hand_idx]
 
         # ── Validate capture ──────────────────────────────────────────────────
-        capture_cards = self._validate_capture(
-            played_card, capture_ids, state.table
-        )
+        capture_cards = self._validate_capture(played_card, capture_ids, state)
 
         # ── Apply move ────────────────────────────────────────────────────────
-        player.hand.remove(played_card)
+        # Structural sharing: only the containers a move actually changes
+        # get fresh copies (the acting player, the table).  The deck, the
+        # opponent's PlayerState, and the score dicts are shared with the
+        # previous state — safe because no engine path ever mutates a
+        # returned state's containers in place.
+        #
+        # The Zobrist hash is maintained incrementally: XOR out each card's
+        # old location key, XOR in its new one.
+        zkey     = _Z.key
+        hand_loc = _ZobristKeys._LOC_HAND + idx
+        cap_loc  = _ZobristKeys._LOC_CAPT + idx
+        h        = state.zobrist ^ zkey(card_id, hand_loc)
+
+        # The played card's position is already known, so the copy drops it
+        # by index instead of a second linear remove() scan.
+        new_hand = list(player.hand)
+        del new_hand[hand_idx]
+
+        last_capture_player_id = state.last_capture_player_id
 
         if capture_cards:
-            # Remove captured cards from table
+            # Remove captured cards from table — ids are unique, so one
+            # filtering pass replaces a remove() scan per captured card.
+            captured_ids = {c.id for c in capture_cards}
+            new_table = [c for c in state.table if c.id not in captured_ids]
             for c in capture_cards:
-                state.table.remove(c)
+                h ^= zkey(c.id, _ZobristKeys._LOC_TABLE) ^ zkey(c.id, cap_loc)
             # Award played card + captured cards to player
-            player.captured.append(played_card)
-            player.captured.extend(capture_cards)
-            state.last_capture_player_id = player_id
-
-            # Scopa check — cannot score scopa on the very last round capture
-            # (taking the last card as end-of-round sweep is not a scopa)
-            if not state.table and state.deck:
-                state = self._apply_scopa(state, player_id)
+            new_captured = player.captured + [played_card]
+            new_captured.extend(capture_cards)
+            last_capture_player_id = player_id
+            h ^= zkey(card_id, cap_loc)
+            # Fold the gained cards into the maintained scoring counters.
+            coins, settebello, best = _fold_captured(
+                player.coins_count,
+                player.has_settebello,
+                player.primiera_best,
+                new_captured[len(player.captured):],
+                state.config,
+            )
+            new_player = replace(
+                player,
+                hand=new_hand,
+                captured=new_captured,
+                coins_count=coins,
+                has_settebello=settebello,
+                primiera_best=best,
+            )
         else:
-            # Discard — card goes face-up on the table
-            state.table.append(played_card)
+            # Discard — card goes face-up on the table.  The captured pile
+            # is untouched, so the list itself (and the counters) are shared.
+            new_table = state.table + [played_card]
+            h ^= zkey(card_id, _ZobristKeys._LOC_TABLE)
+            new_player = replace(player, hand=new_hand)
+        state = GameState(
+            deck=state.deck,  # a move never touches the draw pile
+            table=new_table,
+            players=[new_player if p is player else p for p in state.players],
+            current_player_index=idx,
+            last_capture_player_id=last_capture_player_id,
+            scores=state.scores,
+            phase=state.phase,
+            config=state.config,
+            zobrist=h,
+            live_scores=state.live_scores,
+        )
+
+        # Scopa check — cannot score scopa on the very last round capture
+        # (taking the last card as end-of-round sweep is not a scopa)
+        if capture_cards and not new_table and state.deck:
+            state = self._apply_scopa(state, idx)
 
         state = self._advance_turn(state)
         return state
@@ -414,8 +776,7 @@ class ScopaEngine:
         GameState
             State with freshly dealt hands, or the unchanged state.
         """
-        if state.deck and all(len(p.hand) == 0 for p in state.players):
-            state = self._deep_copy_state(state)
+        if state.deck and state.hands_total == 0:
             state = self._deal_hands(state)
         return state
 
@@ -425,11 +786,11 @@ class ScopaEngine:
 
         A round ends when the deck is empty **and** all players' hands are
         empty (all 40 cards have been played or are on the table).
+
+        Both operands are maintained counts — the check is two int
+        comparisons, cheap enough for tight AI search loops.
         """
-        return (
-            len(state.deck) == 0
-            and all(len(p.hand) == 0 for p in state.players)
-        )
+        return not state.deck and state.hands_total == 0
 
     def calculate_round_score(self, state: GameState) -> GameState:
         """
@@ -454,36 +815,50 @@ class ScopaEngine:
                 "calculate_round_score called before the round is over."
             )
 
-        state = self._deep_copy_state(state)
-
         # ── Award remaining table cards to last capturer ───────────────────────
+        # Structural sharing again: at most one PlayerState (the last
+        # capturer) gains cards, so everyone else is carried over as-is.
+        zkey = _Z.key
+        h = state.zobrist
+        players = state.players
+        cfg = state.config
+
         if state.table and state.last_capture_player_id:
             last_capturer = state.player_by_id(state.last_capture_player_id)
-            last_capturer.captured.extend(state.table)
-            state.table = []
+            cap_loc = _ZobristKeys._LOC_CAPT + players.index(last_capturer)
+            for c in state.table:
+                h ^= zkey(c.id, _ZobristKeys._LOC_TABLE) ^ zkey(c.id, cap_loc)
+            coins, settebello, best = _fold_captured(
+                last_capturer.coins_count,
+                last_capturer.has_settebello,
+                last_capturer.primiera_best,
+                state.table,
+                cfg,
+            )
+            swept = replace(
+                last_capturer,
+                captured=last_capturer.captured + state.table,
+                coins_count=coins,
+                has_settebello=settebello,
+                primiera_best=best,
+            )
+            players = [swept if p is last_capturer else p for p in players]
         elif state.table:
             # Edge case: nobody ever captured (impossible in standard play but
             # handle defensively — cards are simply discarded).
-            state.table = []
+            for c in state.table:
+                h ^= zkey(c.id, _ZobristKeys._LOC_TABLE)
 
         # ── Scoring ───────────────────────────────────────────────────────────
-        cfg = state.config
+        # Every category reads the counters maintained move-by-move in
+        # play_card — O(players) here, with no re-scan of the captured
+        # piles accumulated over the round.
+        captured_counts = {p.id: len(p.captured) for p in players}
+        coins_counts    = {p.id: p.coins_count for p in players}
+        has_settebello  = {p.id: p.has_settebello for p in players}
+        primiera_scores = {p.id: sum(p.primiera_best) for p in players}
 
-        captured_counts = {p.id: len(p.captured) for p in state.players}
-        coins_counts    = {
-            p.id: sum(1 for c in p.captured if c.suit == cfg.coins_suit)
-            for p in state.players
-        }
-        has_settebello  = {
-            p.id: any(
-                c.suit == cfg.coins_suit and c.value == 7
-                for c in p.captured
-            )
-            for p in state.players
-        }
-        primiera_scores = {p.id: self._calculate_primiera(p, cfg) for p in state.players}
-
-        additions: dict[str, int] = {p.id: 0 for p in state.players}
+        additions: dict[str, int] = {p.id: 0 for p in players}
 
         # Most captured cards (tie → nobody scores)
         additions = self._award_most(additions, captured_counts)
@@ -500,15 +875,27 @@ class ScopaEngine:
         additions = self._award_most(additions, primiera_scores)
 
         # Accumulated scopas (+1 each)
-        for p in state.players:
+        for p in players:
             additions[p.id] += p.scopas
 
         # Write final scores
+        scores = dict(state.scores)
         for pid, pts in additions.items():
-            state.scores[pid] = pts
+            scores[pid] = pts
 
-        state.phase = "finished"
-        return state
+        return GameState(
+            deck=state.deck,
+            table=[],
+            players=players,
+            current_player_index=state.current_player_index,
+            last_capture_player_id=state.last_capture_player_id,
+            scores=scores,
+            phase="finished",
+            config=cfg,
+            zobrist=h,
+            # The maintained view is rebuilt with the finalised totals.
+            live_scores={p.id: scores[p.id] + p.scopas for p in players},
+        )
 
     # ── Private helpers: validation ───────────────────────────────────────────
 
@@ -516,7 +903,7 @@ class ScopaEngine:
         self,
         played_card: Card,
         capture_ids: list[str],
-        table: list[Card],
+        state: GameState,
     ) -> list[Card]:
         """
         Validate the proposed capture and return the cards to be captured.
@@ -538,8 +925,9 @@ class ScopaEngine:
         if not capture_ids:
             return []
 
-        # Resolve IDs → cards
-        table_by_id: dict[str, Card] = {c.id: c for c in table}
+        # Resolve IDs → cards via the state's shared table index — the
+        # same map an AI consulted while picking this move.
+        table_by_id = state.table_index()
         missing = [cid for cid in capture_ids if cid not in table_by_id]
         if missing:
             raise InvalidCaptureError(
@@ -565,7 +953,7 @@ class ScopaEngine:
         # value, the player MUST capture it — sum combinations are illegal.
         if len(capture_cards) > 1:
             exact_match = next(
-                (c for c in table if c.value == played_card.value), None
+                (c for c in state.table if c.value == played_card.value), None
             )
             if exact_match is not None:
                 raise EqualValuePriorityError(
@@ -599,21 +987,80 @@ class ScopaEngine:
         list[list[Card]]
             All valid capture subsets (may be empty).
         """
-        results: list[list[Card]] = []
+        return list(self._iter_sum_combinations(target, table))
 
+    def _iter_sum_combinations(
+        self,
+        target: int,
+        table: list[Card],
+    ):
+        """
+        Lazily yield the subsets of *table* whose values sum to *target*.
+
+        Generator counterpart of :py:meth:`_find_sum_combinations` with the
+        same semantics (exact match short-circuits all sum combinations).
+        Consumers that can stop early — e.g. an AI that halts as soon as a
+        table-clearing combo appears — avoid enumerating the remaining
+        subsets entirely; callers that need the full list should use the
+        eager method.
+
+        Yields
+        ------
+        list[Card]
+            One valid capture subset at a time.
+        """
         # Single-card exact match (separate from sum combinations)
         for card in table:
             if card.value == target:
-                results.append([card])
-                return results  # exact match found → only legal option
-
-        # Multi-card sum combinations
-        for size in range(2, len(table) + 1):
-            for combo in combinations(table, size):
-                if sum(c.value for c in combo) == target:
-                    results.append(list(combo))
-
-        return results
+                yield [card]
+                return  # exact match found → only legal option
+
+        n = len(table)
+        if n < 2:
+            return
+
+        # Multi-card sum combinations.  For normal table sizes the shared
+        # subset-sum index answers the query: it tabulates every mask's sum
+        # with a bitmask DP once per distinct table-value tuple and is
+        # cached, so the 1-10 targets an AI probes against the same table
+        # all hit the same precomputed structure.  Masks come back in the
+        # order the nested ``combinations`` loop used: size ascending,
+        # lexicographic within a size.
+        if n <= self._SUBSET_DP_MAX:
+            values = tuple(c.value for c in table)
+            for mask in _table_sum_index(values).get(target, ()):
+                yield [table[i] for i in range(n) if mask >> i & 1]
+            return
+
+        # Degenerate many-card tables (n > _SUBSET_DP_MAX): meet in the
+        # middle rather than allocating a 2^n DP array or enumerating all
+        # 2^n combinations.  Subset sums of each half cost 2^(n/2) apiece;
+        # every hit is an A-half subset joined with a B-half subset whose
+        # sums are complementary.  Hits are re-sorted into the canonical
+        # order (size ascending, lexicographic within a size).
+        values = [c.value for c in table]
+        half = n // 2
+
+        sums_b: dict[int, list[tuple[int, ...]]] = {}
+        for size in range(n - half + 1):
+            for idxs in combinations(range(half, n), size):
+                s = sum(values[i] for i in idxs)
+                if s <= target:
+                    sums_b.setdefault(s, []).append(idxs)
+
+        hits: list[tuple[int, ...]] = []
+        for size in range(half + 1):
+            for idxs in combinations(range(half), size):
+                s = sum(values[i] for i in idxs)
+                if s > target:
+                    continue
+                for b_idxs in sums_b.get(target - s, ()):
+                    if len(idxs) + len(b_idxs) >= 2:
+                        hits.append(idxs + b_idxs)
+
+        hits.sort(key=lambda t: (len(t), t))
+        for idxs in hits:
+            yield [table[i] for i in idxs]
 
     # ── Private helpers: scoring ──────────────────────────────────────────────
 
@@ -633,27 +1080,33 @@ class ScopaEngine:
         -------
         int
             Sum of best primiera values across all four standard suits.
+
+        Round scoring reads the maintained ``primiera_best`` counters
+        instead; this helper recomputes from the pile for callers holding
+        a hand-built PlayerState.
         """
-        suits = ("bastoni", "coppe", "oro", "spade")
-        total = 0
-        for suit in suits:
-            suit_cards = [c for c in player.captured if c.suit == suit]
-            if suit_cards:
-                best = max(cfg.primiera_score(c.value) for c in suit_cards)
-                total += best
-        return total
+        _, _, best = _fold_captured(0, False, (0, 0, 0, 0), player.captured, cfg)
+        return sum(best)
 
-    def _apply_scopa(self, state: GameState, player_id: str) -> GameState:
+    def _apply_scopa(self, state: GameState, idx: int) -> GameState:
         """
-        Increment *player_id*'s scopa counter.
+        Increment the scopa counter of the player at index *idx*.
 
         Called only when the table is cleared by a capture **and** the deck
         is not empty (last-hand table clear is not a scopa).
 
-        Returns the modified state (already a deep copy from the caller).
+        Returns the modified state.  *state* is the caller's freshly built
+        state whose acting PlayerState is private to it; the live-score
+        view may still be shared with the predecessor, so it is replaced
+        rather than mutated.
         """
-        player = state.player_by_id(player_id)
+        player = state.players[idx]
+        state.zobrist ^= _Z.scopa_key(idx, player.scopas)
         player.scopas += 1
+        state.zobrist ^= _Z.scopa_key(idx, player.scopas)
+        live_scores = dict(state.live_scores)
+        live_scores[player.id] += 1
+        state.live_scores = live_scores
         return state
 
     def _advance_turn(self, state: GameState) -> GameState:
@@ -666,6 +1119,9 @@ class ScopaEngine:
         state.current_player_index = (
             state.current_player_index + 1
         ) % len(state.players)
+        # Two-player toggle: the side-to-move key flips in and out of the
+        # hash as the index alternates between 0 and 1.
+        state.zobrist ^= _Z.turn_key
         return state
 
     # ── Private helpers: dealing ──────────────────────────────────────────────
@@ -679,15 +1135,22 @@ class ScopaEngine:
         """
         cfg = state.config
 
-        # Table cards
+        # Table cards — the in-place reassignment also drops any cached
+        # table index (there is none yet on a freshly built state, but the
+        # reset keeps the invariant local and obvious).
         state.table = state.deck[: cfg.initial_table_size]
+        state._table_by_id = None
         state.deck = state.deck[cfg.initial_table_size :]
 
-        # Deal hands — deal one card at a time round-robin (authentic dealing)
-        for _ in range(cfg.hand_size):
-            for player in state.players:
-                if state.deck:
-                    player.hand.append(state.deck.pop(0))
+        # Deal hands — one card at a time round-robin (authentic dealing).
+        # Round-robin from the deck top is exactly a stride slice per
+        # player, which avoids the O(deck) shift each pop(0) would cost.
+        n_players = len(state.players)
+        dealt = state.deck[: cfg.hand_size * n_players]
+        state.deck = state.deck[len(dealt) :]
+        for i, player in enumerate(state.players):
+            player.hand.extend(dealt[i::n_players])
+        state.hands_total = len(dealt)
 
         return state
 
@@ -697,20 +1160,58 @@ class ScopaEngine:
 
         Called by :py:meth:`deal_if_needed` when all hands are empty.
         No new table cards are dealt mid-round (only at game start).
+
+        Builds a new state sharing everything a deal does not touch: the
+        table, the captured piles, and the score dicts.
         """
         cfg = state.config
-        for _ in range(cfg.hand_size):
-            for player in state.players:
-                if state.deck:
-                    player.hand.append(state.deck.pop(0))
-        return state
+        zkey = _Z.key
+        n_players = len(state.players)
+
+        # Same stride-slice dealing as _deal_initial: card j off the deck
+        # top goes to player j % n_players, with no pop(0) shifting.
+        dealt = state.deck[: cfg.hand_size * n_players]
+        deck = state.deck[len(dealt) :]
+
+        hands: list[list[Card]] = [list(p.hand) for p in state.players]
+        h = state.zobrist
+        for j, card in enumerate(dealt):
+            i = j % n_players
+            hands[i].append(card)
+            h ^= (
+                zkey(card.id, _ZobristKeys._LOC_DECK)
+                ^ zkey(card.id, _ZobristKeys._LOC_HAND + i)
+            )
+        return GameState(
+            deck=deck,
+            table=state.table,
+            players=[
+                replace(p, hand=hands[i])
+                for i, p in enumerate(state.players)
+            ],
+            current_player_index=state.current_player_index,
+            last_capture_player_id=state.last_capture_player_id,
+            scores=state.scores,
+            phase=state.phase,
+            config=cfg,
+            zobrist=h,
+            live_scores=state.live_scores,
+        )
 
     # ── Private helpers: utilities ────────────────────────────────────────────
 
     @staticmethod
-    def _find_card_in_list(card_id: str, cards: list[Card]) -> Optional[Card]:
-        """Return the first card in *cards* with ``Card.id == card_id``, or ``None``."""
-        return next((c for c in cards if c.id == card_id), None)
+    def _find_card_index(card_id: str, cards: list[Card]) -> int:
+        """
+        Return the index of the first card in *cards* with
+        ``Card.id == card_id``, or ``-1`` when absent.  Returning the index
+        lets the caller both read the card and drop it from a copy by
+        position, without a second scan.
+        """
+        for i, c in enumerate(cards):
+            if c.id == card_id:
+                return i
+        return -1
 
     @staticmethod
     def _award_most(
@@ -731,37 +1232,17 @@ class ScopaEngine:
         """
         if not counts:
             return additions
+        if len(counts) == 2:
+            # Two-player games (the only kind the engine currently deals)
+            # need one comparison, not a max() pass plus a winner scan.
+            (a_id, a), (b_id, b) = counts.items()
+            if a > b:
+                additions[a_id] += 1
+            elif b > a:
+                additions[b_id] += 1
+            return additions
         max_val = max(counts.values())
         winners = [pid for pid, v in counts.items() if v == max_val]
         if len(winners) == 1:
             additions[winners[0]] += 1
         return additions
-
-    @staticmethod
-    def _deep_copy_state(state: GameState) -> GameState:
-        """
-        Return a deep copy of *state* so the engine never mutates caller data.
-
-        ``Card`` objects themselves are frozen dataclasses — they are safe to
-        share without copying.  Only the mutable container objects (lists,
-        dicts, :class:`PlayerState`) need duplication.
-        """
-        new_players = [
-            PlayerState(
-                id=p.id,
-                hand=list(p.hand),
-                captured=list(p.captured),
-                scopas=p.scopas,
-            )
-            for p in state.players
-        ]
-        return GameState(
-            deck=list(state.deck),
-            table=list(state.table),
-            players=new_players,
-            current_player_index=state.current_player_index,
-            last_capture_player_id=state.last_capture_player_id,
-            scores=dict(state.scores),
-            phase=state.phase,
-            config=state.config,  # frozen dataclass — safe to share
-        )
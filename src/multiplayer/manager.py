@@ -19,10 +19,10 @@ Usage
 
 from __future__ import annotations
 
+import heapq
 import secrets
 import string
 import time
-import uuid
 
 from .models import MultiplayerSession
 
@@ -33,18 +33,43 @@ _JOIN_CODE_LENGTH      = 6
 
 # ── ID generators ─────────────────────────────────────────────────────────────
 
+#: Join-code alphabet as bytes plus the rejection threshold for uniform
+#: byte → symbol mapping: bytes at or above the largest multiple of the
+#: alphabet size below 256 are discarded so ``% len(alphabet)`` stays
+#: unbiased.
+_ALPHABET_BYTES = _JOIN_CODE_ALPHABET.encode()
+_REJECT_FROM    = 256 - 256 % len(_ALPHABET_BYTES)
+
+
 def _gen_join_code() -> str:
-    return "".join(
-        secrets.choice(_JOIN_CODE_ALPHABET) for _ in range(_JOIN_CODE_LENGTH)
-    )
+    # One token_bytes call replaces six secrets.choice calls (each a
+    # separate randbelow draw).  A couple of spare bytes cover the rare
+    # rejections; the loop re-draws in the (vanishingly unlikely) case
+    # they don't.
+    alphabet = _ALPHABET_BYTES
+    n = len(alphabet)
+    out = bytearray()
+    need = _JOIN_CODE_LENGTH
+    while need:
+        for b in secrets.token_bytes(need + 2):
+            if b < _REJECT_FROM:
+                out.append(alphabet[b % n])
+                need -= 1
+                if not need:
+                    break
+    return out.decode("ascii")
 
 
 def _gen_player_id() -> str:
-    return str(uuid.uuid4())[:8]
+    # 8 hex chars of OS entropy — same length as the old truncated UUID
+    # without building and slicing a 36-char UUID string first.
+    return secrets.token_hex(4)
 
 
 def _gen_session_id() -> str:
-    return str(uuid.uuid4())
+    # Session IDs are opaque dict keys / URL path segments; 128 bits of
+    # hex is equivalent entropy to a UUID4 in a cheaper wrapper.
+    return secrets.token_hex(16)
 
 
 # ── Manager ───────────────────────────────────────────────────────────────────
@@ -60,7 +85,10 @@ class SessionManager:
 
     def __init__(self) -> None:
         self._sessions:   dict[str, MultiplayerSession] = {}
-        self._join_codes: dict[str, str]                = {}  # join_code → session_id
+        self._join_codes: dict[str, MultiplayerSession] = {}  # join_code → session
+        # (expiry timestamp, session_id) min-heap so cleanup stops at the
+        # first entry that is still fresh instead of scanning every session.
+        self._expiry_heap: list[tuple[float, str]]      = []
 
     # ── Session lifecycle ─────────────────────────────────────────────────────
 
@@ -82,7 +110,11 @@ class SessionManager:
             player_ids=[creator_id],
         )
         self._sessions[session_id]  = session
-        self._join_codes[join_code] = session_id
+        self._join_codes[join_code] = session
+        heapq.heappush(
+            self._expiry_heap,
+            (session.created_at + _CLEANUP_AFTER_SECONDS, session_id),
+        )
         return session, creator_id
 
     def join_session(self, join_code: str) -> tuple[MultiplayerSession, str]:
@@ -105,12 +137,11 @@ class SessionManager:
         ValueError
             If the session is full or no longer in ``"waiting"`` state.
         """
-        join_code  = join_code.strip().upper()
-        session_id = self._join_codes.get(join_code)
-        if session_id is None:
+        join_code = join_code.strip().upper()
+        session = self._join_codes.get(join_code)
+        if session is None:
             raise KeyError(f"Join code '{join_code}' not found.")
 
-        session = self._sessions[session_id]
         if session.status != "waiting":
             raise ValueError("Session is no longer accepting players.")
         if len(session.player_ids) >= 2:
@@ -118,6 +149,8 @@ class SessionManager:
 
         joiner_id = _gen_player_id()
         session.player_ids.append(joiner_id)
+        creator_id = session.player_ids[0]
+        session._opponent = {creator_id: joiner_id, joiner_id: creator_id}
         return session, joiner_id
 
     def get_session(self, session_id: str) -> MultiplayerSession:
@@ -150,18 +183,24 @@ class SessionManager:
         -------
         int
             Number of sessions removed.
+
+        Notes
+        -----
+        Sessions expire in creation order, so the expiry heap lets the
+        loop stop at the first still-fresh entry — O(k log N) for k
+        expired sessions instead of a scan of all N on every timer tick.
         """
         now = time.time()
-        stale = [
-            sid
-            for sid, s in self._sessions.items()
-            if now - s.created_at > _CLEANUP_AFTER_SECONDS
-        ]
-        for sid in stale:
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            _, sid = heapq.heappop(heap)
             session = self._sessions.pop(sid, None)
-            if session:
-                self._join_codes.pop(session.join_code, None)
-        return len(stale)
+            if session is None:
+                continue  # already removed by an earlier cleanup path
+            self._join_codes.pop(session.join_code, None)
+            removed += 1
+        return removed
 
     def _unique_join_code(self) -> str:
         """Generate a join code that is not already in use."""
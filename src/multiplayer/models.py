@@ -21,8 +21,6 @@ import time
 from dataclasses import dataclass, field
 from typing import Optional
 
-import src.decks  # noqa: F401 — registers all deck definitions on import
-
 from src.engine import Card, ScopaEngine, ScopaEngineError, loadDeck
 from src.engine.scopa import GameState
 from src.app.serializer import serialize_public_state
@@ -32,6 +30,13 @@ from src.app.serializer import serialize_public_state
 #  MultiplayerGameSession
 # ─────────────────────────────────────────────────────────────────────────────
 
+#: Web-ready deck per deck name: the 40 Cards with image URLs rewritten to
+#: frontend-served paths.  Deck contents are immutable per name, so the
+#: rewrite is paid once per process instead of once per ``start_round``;
+#: the frozen Card instances are shared safely across sessions.
+_WEB_DECK_CACHE: dict[str, tuple[Card, ...]] = {}
+
+
 class MultiplayerGameSession:
     """
     ScopaEngine wrapper for 2-human multiplayer games.
@@ -45,6 +50,21 @@ class MultiplayerGameSession:
     SvelteKit frontend serves from its ``/static/assets/`` directory.
     """
 
+    __slots__ = (
+        "player_ids",
+        "deck_name",
+        "seed",
+        "_engine",
+        "_state",
+        "_round_number",
+        "_first_player_index",
+        "_pid_index",
+        "_cum",
+        "round_history",
+        "_hand_index",
+        "_captures_cache",
+    )
+
     def __init__(
         self,
         player_ids: list[str],
@@ -60,8 +80,19 @@ class MultiplayerGameSession:
         self._state: Optional[GameState] = None
         self._round_number = 0
         self._first_player_index = 0          # alternates each round
-        self.cumulative_scores: dict[str, int] = {pid: 0 for pid in player_ids}
+        # Cumulative match totals live in a 2-slot list indexed through
+        # _pid_index; dicts are materialised only when handed out (the
+        # cumulative_scores property, the finalize_round payload).
+        self._pid_index = {pid: i for i, pid in enumerate(player_ids)}
+        self._cum = [0] * len(player_ids)
         self.round_history: list[dict] = []
+        # player_id → {card_id → Card} over current hands; built lazily on
+        # first legality query and dropped whenever the hands change.
+        self._hand_index: Optional[dict[str, dict[str, Card]]] = None
+        # card value → legal capture id-lists for the *current* table.
+        # Cleared with _hand_index on every table change, so the value
+        # alone is a sufficient key between moves.
+        self._captures_cache: dict[int, list[list[str]]] = {}
 
     # ── Round lifecycle ───────────────────────────────────────────────────────
 
@@ -82,6 +113,8 @@ class MultiplayerGameSession:
         )
         # Next round the other player starts
         self._first_player_index = (self._first_player_index + 1) % len(self.player_ids)
+        self._hand_index = None
+        self._captures_cache.clear()
 
     def _load_web_cards(self) -> list[Card]:
         """
@@ -89,17 +122,35 @@ class MultiplayerGameSession:
 
         Converts filesystem URLs to ``/assets/napolitane/{suit}/{value}_{suit}.png``
         so the SvelteKit frontend can serve them from ``/static/assets/``.
+
+        The rewritten deck is cached per deck name (see
+        :data:`_WEB_DECK_CACHE`); each round receives a fresh list over the
+        same shared immutable Cards, which ``create_game`` shuffles on its
+        own copy anyway.
         """
-        raw = loadDeck(self.deck_name)
-        return [
-            Card(
-                suit=c.suit,
-                value=c.value,
-                id=c.id,
-                image_url=f"/assets/napolitane/{c.suit}/{c.value}_{c.suit}.png",
+        deck = _WEB_DECK_CACHE.get(self.deck_name)
+        if deck is None:
+            # Deferred so that SessionManager-only workers (create/join/
+            # cleanup, health checks) never pay for deck registration;
+            # after the first round this is a sys.modules cache hit at
+            # most, and usually skipped entirely by the deck cache.
+            import src.decks  # noqa: F401 — registers all deck definitions
+
+            # The static-asset prefix is invariant across the 40 cards,
+            # so it is built once; the per-card format then only fills in
+            # suit and value.  (Cache misses happen once per deck name,
+            # so this is mostly about keeping the one pass lean.)
+            prefix = f"/assets/{self.deck_name}"
+            deck = _WEB_DECK_CACHE[self.deck_name] = tuple(
+                Card(
+                    suit=c.suit,
+                    value=c.value,
+                    id=c.id,
+                    image_url=f"{prefix}/{c.suit}/{c.value}_{c.suit}.png",
+                )
+                for c in loadDeck(self.deck_name)
             )
-            for c in raw
-        ]
+        return list(deck)
 
     # ── Moves ─────────────────────────────────────────────────────────────────
 
@@ -123,12 +174,13 @@ class MultiplayerGameSession:
         self._state = self._engine.play_card(
             self._state, player_id, card_id, capture_ids
         )
-        # Detect whether deal_if_needed will actually deal cards.
-        needs_deal = (
-            bool(self._state.deck)
-            and all(len(p.hand) == 0 for p in self._state.players)
-        )
+        # Detect whether deal_if_needed will actually deal cards — the
+        # engine's maintained hands_total count makes this two int checks
+        # instead of a generator pass over the hands on every move.
+        needs_deal = bool(self._state.deck) and self._state.hands_total == 0
         self._state = self._engine.deal_if_needed(self._state)
+        self._hand_index = None
+        self._captures_cache.clear()
         return needs_deal
 
     # ── Queries ───────────────────────────────────────────────────────────────
@@ -144,12 +196,30 @@ class MultiplayerGameSession:
         discarded.
         """
         self._require_active()
-        player = self._state.player_by_id(player_id)
-        card = next((c for c in player.hand if c.id == card_id), None)
+        index = self._hand_index
+        if index is None:
+            # One pass over both hands serves every hover query until the
+            # next move changes them.
+            index = self._hand_index = {
+                p.id: {c.id: c for c in p.hand} for p in self._state.players
+            }
+        try:
+            card = index[player_id].get(card_id)
+        except KeyError:
+            raise KeyError(f"No player with id '{player_id}'.") from None
         if card is None:
             raise KeyError(f"Card '{card_id}' not in player '{player_id}' hand.")
-        combos = self._engine._find_sum_combinations(card.value, self._state.table)
-        return [[c.id for c in combo] for combo in combos]
+        combos = self._captures_cache.get(card.value)
+        if combos is None:
+            # Hovering several cards of the same value (or re-hovering one)
+            # re-enumerates nothing — the table is fixed until the next move.
+            combos = self._captures_cache[card.value] = [
+                [c.id for c in combo]
+                for combo in self._engine._find_sum_combinations(
+                    card.value, self._state.table
+                )
+            ]
+        return combos
 
     def get_state_for_player(self, player_id: str) -> dict:
         """
@@ -172,6 +242,11 @@ class MultiplayerGameSession:
     def round_number(self) -> int:
         return self._round_number
 
+    @property
+    def cumulative_scores(self) -> dict[str, int]:
+        """Cumulative match totals as a fresh ``player_id → points`` dict."""
+        return {pid: self._cum[i] for pid, i in self._pid_index.items()}
+
     # ── Scoring ───────────────────────────────────────────────────────────────
 
     def finalize_round(self) -> dict:
@@ -188,8 +263,10 @@ class MultiplayerGameSession:
         self._require_active()
         self._state = self._engine.calculate_round_score(self._state)
         round_scores = dict(self._state.scores)
+        pid_index = self._pid_index
+        cum = self._cum
         for pid, pts in round_scores.items():
-            self.cumulative_scores[pid] += pts
+            cum[pid_index[pid]] += pts
         entry = {
             "round_number": self._round_number,
             "round_scores": round_scores,
@@ -198,7 +275,7 @@ class MultiplayerGameSession:
         self.round_history.append(entry)
         return {
             "round_scores": round_scores,
-            "cumulative":   dict(self.cumulative_scores),
+            "cumulative":   {pid: cum[i] for pid, i in pid_index.items()},
             "round_number": self._round_number,
             "scopas":       entry["scopas"],
         }
@@ -214,11 +291,14 @@ class MultiplayerGameSession:
 #  MultiplayerSession
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class MultiplayerSession:
     """
     WebSocket session record.
 
+    Slotted: a busy server keeps thousands of these alive, and the
+    per-instance ``__dict__`` would dwarf the handful of declared fields.
+
     Holds two player IDs, their live WebSocket connections, the
     ``MultiplayerGameSession`` instance, and an asyncio lock to serialise
     concurrent move submissions.
@@ -244,6 +324,11 @@ class MultiplayerSession:
     # Serialises concurrent moves — one lock per session
     _lock: asyncio.Lock                          = field(default_factory=asyncio.Lock)
 
+    # player_id → opponent player_id, both directions.  Filled by
+    # SessionManager.join_session once the second player exists; empty
+    # while the session is still waiting.
+    _opponent: dict[str, str]                    = field(default_factory=dict)
+
     def is_full(self) -> bool:
         """Return ``True`` when both player slots are filled."""
         return len(self.player_ids) == 2
@@ -253,8 +338,14 @@ class MultiplayerSession:
         return len(self.connections) == 2
 
     def other_player_id(self, player_id: str) -> str:
-        """Return the opponent's player ID."""
-        for pid in self.player_ids:
-            if pid != player_id:
-                return pid
-        raise ValueError(f"Player {player_id!r} not in session.")
+        """
+        Return the opponent's player ID.
+
+        Answered from the precomputed two-way map — this runs on every
+        move broadcast, so it should be a single dict lookup rather than
+        a scan of ``player_ids``.
+        """
+        try:
+            return self._opponent[player_id]
+        except KeyError:
+            raise ValueError(f"Player {player_id!r} not in session.") from None